@@ -0,0 +1,76 @@
+"""Admission control for job submission endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response, status
+from fastapi.responses import ORJSONResponse
+
+from .job_store import AbstractJobStore
+
+ADMITTED_PATHS = frozenset({"/jobs/concat", "/jobs/overlay"})
+
+
+class AdmissionController:
+    """Caps the number of admitted-but-unfinished jobs across all API workers.
+
+    Slots are counted in the job store; workers release them when a task finishes.
+    A submission that finds no free slot polls for up to ``queue_timeout`` seconds
+    before being rejected.
+    """
+
+    def __init__(
+        self,
+        job_store: AbstractJobStore,
+        *,
+        max_inflight_jobs: int,
+        queue_timeout: float,
+        poll_interval: float = 0.05,
+    ) -> None:
+        self._job_store = job_store
+        self._max_inflight_jobs = max_inflight_jobs
+        self._queue_timeout = queue_timeout
+        self._poll_interval = poll_interval
+
+    async def acquire(self) -> bool:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._queue_timeout
+        while True:
+            if await self._job_store.acquire_job_slot(self._max_inflight_jobs):
+                return True
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(self._poll_interval, remaining))
+
+    async def release(self) -> None:
+        await self._job_store.release_job_slot()
+
+
+async def admission_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Reserve a job slot before a submission reaches its route handler."""
+
+    controller: AdmissionController | None = getattr(request.app.state, "admission", None)
+    if controller is None or request.method != "POST" or request.url.path not in ADMITTED_PATHS:
+        return await call_next(request)
+
+    if not await controller.acquire():
+        return ORJSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": "Too many jobs in flight, retry later"},
+            headers={"Retry-After": "5"},
+        )
+
+    try:
+        response = await call_next(request)
+    except Exception:
+        await controller.release()
+        raise
+    # Only accepted jobs keep their slot; the worker frees it when the task ends.
+    if response.status_code != status.HTTP_202_ACCEPTED:
+        await controller.release()
+    return response
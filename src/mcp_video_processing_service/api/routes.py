@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
+from typing import Any, Optional
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 
+from ..batching import DynBatcher
 from ..job_models import (
+    BatchStatusRequest,
     ConcatJobRequest,
     JobCreatedResponse,
     JobRecord,
-    JobStatusResponse,
     JobStatus,
+    JobStatusResponse,
     OverlayJobRequest,
 )
 from ..job_store import AbstractJobStore
-from ..tasks import enqueue_concat_job, enqueue_overlay_job
+from ..tasks import enqueue_jobs
+
+JobSubmission = tuple[JobRecord, dict[str, Any]]
 
 
 router = APIRouter()
@@ -28,6 +33,35 @@ def get_job_store(request: Request) -> AbstractJobStore:
     return job_store
 
 
+def get_submission_batcher(request: Request) -> DynBatcher[JobSubmission]:
+    batcher = getattr(request.app.state, "submission_batcher", None)
+    if batcher is None:
+        raise RuntimeError("Submission batcher not configured")
+    return batcher
+
+
+async def persist_and_enqueue(job_store: AbstractJobStore, batch: list[JobSubmission]) -> None:
+    """Store a batch of new jobs in one pipelined write, then publish them to Celery."""
+
+    await job_store.create_jobs([record for record, _ in batch])
+    enqueue_jobs([(record.job_type, record.job_id, params) for record, params in batch])
+
+
+def _to_status_response(record: JobRecord) -> JobStatusResponse:
+    return JobStatusResponse(
+        jobId=record.job_id,
+        jobType=record.job_type,
+        status=record.status,
+        progress=record.progress,
+        resultMediaId=record.result_media_id,
+        message=record.message,
+        error=record.error,
+        createdAt=record.created_at,
+        updatedAt=record.updated_at,
+        metadata=record.metadata,
+    )
+
+
 @router.get("/health", tags=["health"])
 async def healthcheck() -> dict[str, bool]:
     """Liveness probe endpoint."""
@@ -38,40 +72,40 @@ async def healthcheck() -> dict[str, bool]:
 @router.post("/jobs/concat", response_model=JobCreatedResponse, status_code=status.HTTP_202_ACCEPTED)
 async def submit_concat_job(
     request_body: ConcatJobRequest,
-    job_store: AbstractJobStore = Depends(get_job_store),
+    batcher: DynBatcher[JobSubmission] = Depends(get_submission_batcher),
 ) -> JobCreatedResponse:
     """Schedule a concatenation job."""
 
     job_id = uuid4().hex
+    params = request_body.model_dump(mode="json")
     record = JobRecord(
         job_id=job_id,
         job_type="concat",
-        params=request_body.model_dump(mode="json"),
+        params=params,
         metadata=request_body.metadata,
         status=JobStatus.QUEUED,
     )
-    await job_store.create_job(record)
-    enqueue_concat_job(job_id, request_body.model_dump(mode="json"))
+    await batcher.submit((record, params))
     return JobCreatedResponse(jobId=job_id)
 
 
 @router.post("/jobs/overlay", response_model=JobCreatedResponse, status_code=status.HTTP_202_ACCEPTED)
 async def submit_overlay_job(
     request_body: OverlayJobRequest,
-    job_store: AbstractJobStore = Depends(get_job_store),
+    batcher: DynBatcher[JobSubmission] = Depends(get_submission_batcher),
 ) -> JobCreatedResponse:
     """Schedule an overlay rendering job."""
 
     job_id = uuid4().hex
+    params = request_body.model_dump(mode="json")
     record = JobRecord(
         job_id=job_id,
         job_type="overlay",
-        params=request_body.model_dump(mode="json"),
+        params=params,
         metadata=request_body.metadata,
         status=JobStatus.QUEUED,
     )
-    await job_store.create_job(record)
-    enqueue_overlay_job(job_id, request_body.model_dump(mode="json"))
+    await batcher.submit((record, params))
     return JobCreatedResponse(jobId=job_id)
 
 
@@ -86,15 +120,18 @@ async def get_job_status(
     if record is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
 
-    return JobStatusResponse(
-        jobId=record.job_id,
-        jobType=record.job_type,
-        status=record.status,
-        progress=record.progress,
-        resultMediaId=record.result_media_id,
-        message=record.message,
-        error=record.error,
-        createdAt=record.created_at,
-        updatedAt=record.updated_at,
-        metadata=record.metadata,
-    )
+    return _to_status_response(record)
+
+
+@router.post("/jobs/batch", response_model=dict[str, Optional[JobStatusResponse]])
+async def get_job_statuses(
+    request_body: BatchStatusRequest,
+    job_store: AbstractJobStore = Depends(get_job_store),
+) -> dict[str, Optional[JobStatusResponse]]:
+    """Fetch the status of several jobs in one round trip; unknown IDs map to null."""
+
+    records = await job_store.get_jobs(request_body.job_ids)
+    return {
+        job_id: _to_status_response(record) if record else None
+        for job_id, record in zip(request_body.job_ids, records, strict=True)
+    }
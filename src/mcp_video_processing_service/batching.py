@@ -0,0 +1,101 @@
+"""Dynamic batching helpers for the HTTP API."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class DynBatcher(Generic[T]):
+    """Collect concurrently submitted items and process them in batches.
+
+    A batch is handed to ``process_batch`` once it holds ``max_batch_size`` items
+    or ``max_delay`` seconds after its first item arrived, whichever comes first.
+    Each ``submit`` call resolves when its batch has been processed and re-raises
+    the batch error if processing failed.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[list[T]], Awaitable[None]],
+        *,
+        max_batch_size: int = 32,
+        max_delay: float = 0.005,
+    ) -> None:
+        self._process_batch = process_batch
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._queue: asyncio.Queue[tuple[T, asyncio.Future[None]]] = asyncio.Queue()
+        self._batch: list[tuple[T, asyncio.Future[None]]] = []
+        self._worker: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        """Start the background task draining submissions."""
+
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task and fail any submissions still queued."""
+
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        pending = self._batch
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        self._batch = []
+        _resolve(pending, RuntimeError("Batcher stopped before processing submission"))
+
+    async def submit(self, item: T) -> None:
+        """Queue ``item`` and wait until the batch containing it is processed."""
+
+        if self._worker is None:
+            raise RuntimeError("Batcher not started")
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        await future
+
+    async def _collect(self) -> None:
+        self._batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._max_delay
+        while len(self._batch) < self._max_batch_size:
+            if not self._queue.empty():
+                self._batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                self._batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+    async def _run(self) -> None:
+        while True:
+            await self._collect()
+            try:
+                await self._process_batch([item for item, _ in self._batch])
+            except Exception as exc:  # surfaced to every waiting submitter
+                _resolve(self._batch, exc)
+            else:
+                _resolve(self._batch, None)
+            self._batch = []
+
+
+def _resolve(batch: list[tuple[T, asyncio.Future[None]]], error: Optional[BaseException]) -> None:
+    for _, future in batch:
+        if future.done():
+            continue
+        if error is None:
+            future.set_result(None)
+        else:
+            future.set_exception(error)
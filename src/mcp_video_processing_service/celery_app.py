@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from celery import Celery
+from kombu import Queue
 
-from .config import settings
+from .config import runtime_settings as settings
 
 
 def create_celery() -> Celery:
@@ -15,14 +16,32 @@ def create_celery() -> Celery:
         broker_url=settings.celery_broker_url,
         result_backend=settings.celery_result_backend,
         task_default_queue=settings.celery_task_queue,
+        # Declared up front so a worker started without -Q consumes every queue;
+        # -Q only narrows a worker to one of them.
+        task_queues=[
+            Queue(settings.celery_task_queue),
+            Queue(settings.celery_concat_queue),
+            Queue(settings.celery_overlay_queue),
+        ],
+        task_routes={
+            "video.concat": {"queue": settings.celery_concat_queue},
+            "video.overlay": {"queue": settings.celery_overlay_queue},
+        },
         task_acks_late=True,
+        # Encodes run for minutes; never let a busy worker hoard queued jobs.
+        worker_prefetch_multiplier=1,
+        task_acks_on_failure_or_timeout=True,
+        task_reject_on_worker_lost=True,
         worker_max_tasks_per_child=50,
-        task_serializer="json",
-        result_serializer="json",
-        accept_content=["json"],
+        task_serializer="msgpack",
+        result_serializer="msgpack",
+        # JSON stays accepted so tasks enqueued before the switch still run.
+        accept_content=["msgpack", "json"],
         timezone="UTC",
         enable_utc=True,
     )
+    if settings.celery_worker_concurrency:
+        app.conf.worker_concurrency = settings.celery_worker_concurrency
     return app
 
 
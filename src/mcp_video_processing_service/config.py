@@ -3,16 +3,17 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional
 
-from pydantic import AnyUrl, Field
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Runtime configuration sourced from environment variables."""
 
-    payload_base_url: Optional[AnyUrl] = Field(
+    payload_base_url: Optional[str] = Field(
         default=None, description="Base URL of the PayloadCMS API"
     )
     payload_api_token: Optional[str] = Field(
@@ -22,11 +23,59 @@ class Settings(BaseSettings):
     payload_media_collection: str = Field(
         default="media", description="PayloadCMS collection for media assets"
     )
+    payload_media_cache_ttl_seconds: int = Field(
+        default=30,
+        ge=0,
+        description="Seconds PayloadCMS media metadata is cached for (0 disables)",
+    )
+
+    api_host: str = Field(default="0.0.0.0", description="Interface the HTTP API binds to")
+    api_port: int = Field(default=8000, description="Port the HTTP API listens on")
+    api_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Number of uvicorn worker processes serving the HTTP API",
+    )
+
+    submit_batch_max_size: int = Field(
+        default=32,
+        ge=1,
+        description="Maximum job submissions persisted and enqueued together",
+    )
+    submit_batch_max_delay_seconds: float = Field(
+        default=0.005,
+        ge=0.0,
+        description="How long a submission waits for others to join its batch",
+    )
+
+    max_inflight_jobs: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum accepted jobs not yet finished by a worker; 0 disables admission control",
+    )
+    admission_queue_timeout_seconds: float = Field(
+        default=2.0,
+        ge=0.0,
+        description="How long a submission waits for a free job slot before returning 503",
+    )
+    inflight_slot_ttl_seconds: int = Field(
+        default=3600,
+        ge=1,
+        description="Seconds before an unreleased job slot is reclaimed; exceed the longest job",
+    )
 
     redis_url: str = Field(
         default="redis://localhost:6379/0",
         description="Redis connection string for job metadata",
     )
+    redis_max_connections: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Redis connections per process; callers wait for a free connection once "
+            "the pool is full. Unbounded when unset"
+        ),
+    )
     celery_broker_url: str = Field(
         default="redis://localhost:6379/1",
         description="Celery broker connection string",
@@ -39,6 +88,19 @@ class Settings(BaseSettings):
         default="video-processing",
         description="Celery queue for video processing tasks",
     )
+    celery_concat_queue: str = Field(
+        default="video-concat",
+        description="Celery queue for concatenation tasks",
+    )
+    celery_overlay_queue: str = Field(
+        default="video-overlay",
+        description="Celery queue for overlay tasks",
+    )
+    celery_worker_concurrency: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Number of concurrent tasks each Celery worker runs (Celery's per-CPU default when unset)",
+    )
 
     temp_dir: Path = Field(
         default=Path("/tmp/mcp-video-processing"),
@@ -46,6 +108,11 @@ class Settings(BaseSettings):
     )
     ffmpeg_binary: str = Field(default="ffmpeg", description="FFmpeg executable path")
     ffprobe_binary: str = Field(default="ffprobe", description="FFprobe executable path")
+    ffmpeg_threads_per_invocation: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Threads per FFmpeg process; derived from CPU count and worker concurrency when unset",
+    )
     default_output_format: str = Field(
         default="mp4", description="Default output container format"
     )
@@ -59,6 +126,14 @@ class Settings(BaseSettings):
         le=51,
         description="Constant Rate Factor to use for H.264 encoding",
     )
+    h264_preset: str = Field(
+        default="veryfast",
+        description="libx264 preset used for all encodes",
+    )
+    hardware_encoding: bool = Field(
+        default=False,
+        description="Use a detected NVENC/QSV H.264 encoder instead of libx264",
+    )
 
     request_timeout_seconds: float = Field(
         default=30.0,
@@ -71,3 +146,7 @@ class Settings(BaseSettings):
 
 
 settings = Settings()
+
+# Validated once at import; hot paths (tasks, Celery config) read this plain
+# namespace instead of going through the pydantic model on every access.
+runtime_settings = SimpleNamespace(**settings.model_dump())
@@ -2,11 +2,85 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
+from string import Template
 from typing import Iterable, Optional
 
 
-DEFAULT_SCALE_FILTER = "scale=1280:720:force_original_aspect_ratio=decrease,pad=1280:720:(ow-iw)/2:(oh-ih)/2,setsar=1"
+TARGET_WIDTH = 1280
+TARGET_HEIGHT = 720
+DEFAULT_SCALE_FILTER = (
+    f"scale={TARGET_WIDTH}:{TARGET_HEIGHT}:force_original_aspect_ratio=decrease,"
+    f"pad={TARGET_WIDTH}:{TARGET_HEIGHT}:(ow-iw)/2:(oh-ih)/2,setsar=1"
+)
+# Used instead of DEFAULT_SCALE_FILTER when the source is already at the target size.
+PASSTHROUGH_FILTER = "setsar=1"
+
+SOFTWARE_VIDEO_ENCODER = "libx264"
+DEFAULT_H264_PRESET = "veryfast"
+# NVENC uses its own p1 (fastest) .. p7 (slowest) preset scale.
+NVENC_PRESET = "p4"
+
+
+def _thread_args(ffmpeg_threads: Optional[int]) -> list[str]:
+    return ["-threads", str(ffmpeg_threads)] if ffmpeg_threads else []
+
+
+def _hwaccel_args(video_encoder: str) -> list[str]:
+    return [] if video_encoder == SOFTWARE_VIDEO_ENCODER else ["-hwaccel", "auto"]
+
+
+def _input_args(path: Path, video_encoder: str, ffmpeg_threads: Optional[int]) -> list[str]:
+    # Input options only apply to the next -i, so they are repeated for every input.
+    return [*_hwaccel_args(video_encoder), *_thread_args(ffmpeg_threads), "-i", str(path)]
+
+
+@dataclass(frozen=True, slots=True)
+class ConcatSegment:
+    """One input of a trim-and-concat render.
+
+    ``start_ms``/``end_ms`` bound the kept range. Inputs without an audio stream
+    get generated silence, which needs the kept length: ``end_ms`` or else the
+    source ``duration_ms``.
+    """
+
+    path: Path
+    start_ms: Optional[int] = None
+    end_ms: Optional[int] = None
+    has_audio: bool = True
+    duration_ms: Optional[int] = None
+
+    def kept_duration_ms(self) -> int:
+        end_ms = self.end_ms if self.end_ms is not None else self.duration_ms
+        if end_ms is None:
+            raise ValueError(f"Cannot determine the length of silent input {self.path}")
+        return end_ms - (self.start_ms or 0)
+
+
+def build_video_encoder_args(
+    *,
+    video_encoder: str = SOFTWARE_VIDEO_ENCODER,
+    crf: int = 21,
+    preset: str = DEFAULT_H264_PRESET,
+    ffmpeg_threads: Optional[int] = None,
+) -> list[str]:
+    """Return the output-side H.264 encoder arguments for the selected encoder.
+
+    ``crf`` is mapped onto the equivalent constant-quality option for hardware
+    encoders (``-cq`` for NVENC, ``-global_quality`` for QSV).
+    """
+
+    args = ["-c:v", video_encoder, *_thread_args(ffmpeg_threads)]
+    if video_encoder == "h264_nvenc":
+        args.extend(["-cq", str(crf), "-preset", NVENC_PRESET])
+    elif video_encoder == "h264_qsv":
+        args.extend(["-global_quality", str(crf), "-preset", preset])
+    else:
+        args.extend(["-crf", str(crf), "-preset", preset])
+    return args
 
 
 def build_concat_command(
@@ -17,6 +91,11 @@ def build_concat_command(
     output_format: str = "mp4",
     crf: int = 21,
     audio_passthrough: bool = False,
+    ffmpeg_threads: Optional[int] = None,
+    preset: str = DEFAULT_H264_PRESET,
+    video_encoder: str = SOFTWARE_VIDEO_ENCODER,
+    needs_scale: bool = True,
+    stream_copy: bool = False,
 ) -> list[str]:
     """Build the FFmpeg command for concatenating multiple segments.
 
@@ -27,32 +106,101 @@ def build_concat_command(
         output_format: Desired container format.
         crf: Constant Rate Factor for libx264.
         audio_passthrough: Whether to copy audio from sources verbatim.
+        ffmpeg_threads: Thread budget for decoding and encoding; FFmpeg picks
+            its own default when omitted.
+        preset: libx264 speed/compression preset.
+        video_encoder: H.264 encoder, ``libx264`` or a hardware encoder.
+        needs_scale: Whether inputs must be scaled/padded to the target size;
+            the ``-vf`` chain is dropped when they already match it.
+        stream_copy: Remux all streams with ``-c copy`` instead of re-encoding.
+            Only valid when every input shares codec parameters and is
+            already at the target size; encoder options are ignored.
     """
 
-    command = [
-        ffmpeg_binary,
-        "-y",
-        "-f",
-        "concat",
-        "-safe",
-        "0",
-        "-i",
-        str(filelist_path),
-        "-vf",
-        DEFAULT_SCALE_FILTER,
-        "-c:v",
-        "libx264",
-        "-crf",
-        str(crf),
-        "-preset",
-        "medium",
-    ]
+    output = str(output_path.with_suffix(f".{output_format}"))
+    command = [ffmpeg_binary, "-y", "-f", "concat", "-safe", "0"]
+    if stream_copy:
+        command.extend(["-i", str(filelist_path), "-c", "copy", "-movflags", "+faststart", output])
+        return command
+
+    command.extend(_hwaccel_args(video_encoder))
+    command.extend(_thread_args(ffmpeg_threads))
+    command.extend(["-i", str(filelist_path)])
+    if needs_scale:
+        command.extend(["-vf", DEFAULT_SCALE_FILTER])
+    command.extend(
+        build_video_encoder_args(
+            video_encoder=video_encoder,
+            crf=crf,
+            preset=preset,
+            ffmpeg_threads=ffmpeg_threads,
+        )
+    )
 
     if audio_passthrough:
         command.extend(["-c:a", "copy"])
     else:
         command.extend(["-c:a", "aac", "-b:a", "192k"])
 
+    command.extend(["-movflags", "+faststart", output])
+    return command
+
+
+def build_trim_concat_command(
+    ffmpeg_binary: str,
+    segments: list[ConcatSegment],
+    output_path: Path,
+    *,
+    output_format: str = "mp4",
+    crf: int = 21,
+    ffmpeg_threads: Optional[int] = None,
+    preset: str = DEFAULT_H264_PRESET,
+    video_encoder: str = SOFTWARE_VIDEO_ENCODER,
+    needs_scale: bool = True,
+) -> list[str]:
+    """Build one FFmpeg command that trims and concatenates inputs in a single encode.
+
+    Every segment is normalised to the target size and a common audio format so
+    the ``concat`` filter can join them; segments without audio contribute
+    silence of the same length.
+    """
+
+    command = [ffmpeg_binary, "-y"]
+    for segment in segments:
+        command.extend(_input_args(segment.path, video_encoder, ffmpeg_threads))
+
+    scale_filter = DEFAULT_SCALE_FILTER if needs_scale else PASSTHROUGH_FILTER
+    audio_format = "aformat=sample_rates=48000:channel_layouts=stereo"
+    filter_parts: list[str] = []
+    for idx, segment in enumerate(segments):
+        bounds = ":".join(
+            f"{name}={value}ms"
+            for name, value in (("start", segment.start_ms), ("end", segment.end_ms))
+            if value is not None
+        )
+        video_trim = f"trim={bounds}," if bounds else ""
+        filter_parts.append(f"[{idx}:v]{video_trim}setpts=PTS-STARTPTS,{scale_filter}[v{idx}]")
+        if segment.has_audio:
+            audio_trim = f"atrim={bounds}," if bounds else ""
+            filter_parts.append(f"[{idx}:a]{audio_trim}asetpts=PTS-STARTPTS,{audio_format}[a{idx}]")
+        else:
+            filter_parts.append(
+                "anullsrc=channel_layout=stereo:sample_rate=48000,"
+                f"atrim=duration={segment.kept_duration_ms()}ms,{audio_format}[a{idx}]"
+            )
+    labels = "".join(f"[v{idx}][a{idx}]" for idx in range(len(segments)))
+    filter_parts.append(f"{labels}concat=n={len(segments)}:v=1:a=1[outv][outa]")
+
+    command.extend(["-filter_complex", ";".join(filter_parts), "-map", "[outv]", "-map", "[outa]"])
+    command.extend(
+        build_video_encoder_args(
+            video_encoder=video_encoder,
+            crf=crf,
+            preset=preset,
+            ffmpeg_threads=ffmpeg_threads,
+        )
+    )
+    command.extend(["-c:a", "aac", "-b:a", "192k"])
     command.extend(["-movflags", "+faststart", str(output_path.with_suffix(f".{output_format}"))])
     return command
 
@@ -67,51 +215,109 @@ def generate_concat_filelist(inputs: Iterable[Path], filelist_path: Path) -> Non
     filelist_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
-def build_overlay_filter(overlays: list[dict[str, float | int]]) -> str:
+@lru_cache(maxsize=256)
+def _overlay_template(
+    n_overlays: int,
+    has_scale_mask: int,
+    has_opacity_mask: int,
+    has_start_mask: int,
+    has_end_mask: int,
+    needs_scale: bool,
+) -> Template:
+    """Build the filter graph skeleton for one overlay "shape".
+
+    Bit ``i`` of each mask describes overlay ``i + 1``. Numeric values are left
+    as ``${name<idx>}`` placeholders so jobs sharing a shape reuse the template.
+    """
+
+    base_filter = DEFAULT_SCALE_FILTER if needs_scale else PASSTHROUGH_FILTER
+    steps = (
+        _overlay_step(idx, 1 << (idx - 1), has_scale_mask, has_opacity_mask, has_start_mask, has_end_mask)
+        for idx in range(1, n_overlays + 1)
+    )
+    final_label = f"ov{n_overlays}" if n_overlays else "base"
+    return Template(
+        ";".join(
+            chain(
+                (f"[0:v]{base_filter}[base]",),
+                chain.from_iterable(steps),
+                (f"[{final_label}]setsar=1[outv]",),
+            )
+        )
+    )
+
+
+def _overlay_step(
+    idx: int,
+    bit: int,
+    has_scale_mask: int,
+    has_opacity_mask: int,
+    has_start_mask: int,
+    has_end_mask: int,
+) -> tuple[str, ...]:
+    """Return the filter graph parts that composite overlay ``idx`` onto the previous label."""
+
+    label_in = f"ov{idx - 1}" if idx > 1 else "base"
+    components = [
+        component
+        for flag, component in (
+            (has_scale_mask & bit, f"scale=iw*${{scale{idx}}}:ih*${{scale{idx}}}"),
+            (has_opacity_mask & bit, f"format=rgba,colorchannelmixer=aa=${{opacity{idx}}}"),
+        )
+        if flag
+    ]
+    conditions = [
+        condition
+        for flag, condition in (
+            (has_start_mask & bit, f"gte(t,${{start{idx}}})"),
+            (has_end_mask & bit, f"lte(t,${{end{idx}}})"),
+        )
+        if flag
+    ]
+    enable_clause = ":enable='" + "*".join(conditions) + "'" if conditions else ""
+    overlay_stream = f"overlay{idx}" if components else f"{idx}:v"
+    composite = f"[{label_in}][{overlay_stream}]overlay=x=${{x{idx}}}:y=${{y{idx}}}{enable_clause}[ov{idx}]"
+    if components:
+        return (f"[{idx}:v]" + ",".join(components) + f"[overlay{idx}]", composite)
+    return (composite,)
+
+
+def build_overlay_filter(
+    overlays: list[dict[str, float | int]], *, needs_scale: bool = True
+) -> str:
     """Generate an overlay filter_complex string for FFmpeg.
 
     The overlays list contains dictionaries with keys ``index``, ``x``, ``y``, ``start``,
-    ``end``, and ``opacity``.
+    ``end``, and ``opacity``. ``needs_scale=False`` skips scaling/padding the base
+    video when it is already at the target size.
     """
 
-    base_label = "base"
-    filter_parts: list[str] = []
-    filter_parts.append(f"[0:v]{DEFAULT_SCALE_FILTER}[{base_label}]")
-
-    current_label = base_label
+    has_scale_mask = has_opacity_mask = has_start_mask = has_end_mask = 0
+    values: dict[str, object] = {}
 
     for idx, spec in enumerate(overlays, start=1):
-        label_in = current_label
-        label_out = f"ov{idx}"
-        source_label = f"{idx}:v"
-        components: list[str] = []
+        bit = 1 << (idx - 1)
+        values[f"x{idx}"] = int(spec["x"])
+        values[f"y{idx}"] = int(spec["y"])
         if spec.get("scale"):
-            components.append(f"scale=iw*{spec['scale']}:ih*{spec['scale']}")
+            has_scale_mask |= bit
+            values[f"scale{idx}"] = spec["scale"]
         if spec.get("opacity") is not None and spec["opacity"] < 1.0:
-            components.append(f"format=rgba,colorchannelmixer=aa={spec['opacity']}")
-        overlay_stream = source_label
-        if components:
-            filter_parts.append(f"[{source_label}]" + ",".join(components) + f"[overlay{idx}]")
-            overlay_stream = f"overlay{idx}"
-
-        enable_clause = ""
+            has_opacity_mask |= bit
+            values[f"opacity{idx}"] = spec["opacity"]
         start = spec.get("start")
+        if start is not None:
+            has_start_mask |= bit
+            values[f"start{idx}"] = f"{start / 1000:.3f}"
         end = spec.get("end")
-        if start is not None or end is not None:
-            conditions: list[str] = []
-            if start is not None:
-                conditions.append(f"gte(t,{start / 1000:.3f})")
-            if end is not None:
-                conditions.append(f"lte(t,{end / 1000:.3f})")
-            enable_clause = ":enable='" + "*".join(conditions) + "'"
-
-        filter_parts.append(
-            f"[{label_in}][{overlay_stream}]overlay=x={int(spec['x'])}:y={int(spec['y'])}{enable_clause}[{label_out}]"
-        )
-        current_label = label_out
+        if end is not None:
+            has_end_mask |= bit
+            values[f"end{idx}"] = f"{end / 1000:.3f}"
 
-    filter_parts.append(f"[{current_label}]setsar=1[outv]")
-    return ";".join(filter_parts)
+    template = _overlay_template(
+        len(overlays), has_scale_mask, has_opacity_mask, has_start_mask, has_end_mask, needs_scale
+    )
+    return template.substitute(values)
 
 
 def build_overlay_command(
@@ -122,16 +328,30 @@ def build_overlay_command(
     *,
     output_format: str = "mp4",
     filter_graph: Optional[str] = None,
+    ffmpeg_threads: Optional[int] = None,
+    crf: int = 21,
+    preset: str = DEFAULT_H264_PRESET,
+    video_encoder: str = SOFTWARE_VIDEO_ENCODER,
+    needs_scale: bool = True,
 ) -> list[str]:
     """Construct the FFmpeg command for applying overlays to a video."""
 
-    command: list[str] = [ffmpeg_binary, "-y", "-i", str(base_video)]
-    for path in overlay_paths:
-        command.extend(["-i", str(path)])
+    command: list[str] = [ffmpeg_binary, "-y"]
+    for path in (base_video, *overlay_paths):
+        command.extend(_input_args(path, video_encoder, ffmpeg_threads))
 
-    graph = filter_graph or f"[0:v]{DEFAULT_SCALE_FILTER}[outv]"
+    graph = filter_graph or f"[0:v]{DEFAULT_SCALE_FILTER if needs_scale else PASSTHROUGH_FILTER}[outv]"
     command.extend(["-filter_complex", graph, "-map", "[outv]"])
     # Map audio from first input
-    command.extend(["-map", "0:a?", "-c:v", "libx264", "-crf", "21", "-preset", "medium", "-c:a", "aac", "-b:a", "192k"])
+    command.extend(["-map", "0:a?"])
+    command.extend(
+        build_video_encoder_args(
+            video_encoder=video_encoder,
+            crf=crf,
+            preset=preset,
+            ffmpeg_threads=ffmpeg_threads,
+        )
+    )
+    command.extend(["-c:a", "aac", "-b:a", "192k"])
     command.extend(["-movflags", "+faststart", str(output_path.with_suffix(f".{output_format}"))])
     return command
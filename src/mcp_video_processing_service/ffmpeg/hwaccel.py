@@ -0,0 +1,67 @@
+"""Detection of hardware H.264 encoders usable by FFmpeg."""
+
+from __future__ import annotations
+
+import subprocess
+from functools import lru_cache
+from typing import Optional
+
+# Checked in order of preference. VAAPI is not listed: it needs an explicit
+# device and hwupload filters that the software filter graphs do not emit.
+HARDWARE_H264_ENCODERS = ("h264_nvenc", "h264_qsv")
+
+
+def _encoder_works(ffmpeg_binary: str, encoder: str) -> bool:
+    command = [
+        ffmpeg_binary,
+        "-hide_banner",
+        "-v",
+        "error",
+        "-f",
+        "lavfi",
+        "-i",
+        "color=size=256x256:duration=0.1",
+        "-c:v",
+        encoder,
+        "-f",
+        "null",
+        "-",
+    ]
+    try:
+        completed = subprocess.run(
+            command,
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=30,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return completed.returncode == 0
+
+
+@lru_cache(maxsize=None)
+def detect_hardware_encoder(ffmpeg_binary: str) -> Optional[str]:
+    """Return the first hardware H.264 encoder that can actually encode, if any.
+
+    FFmpeg lists encoders it was built with even when no matching device is
+    present, so each candidate is confirmed with a tiny test encode. The result
+    is cached for the lifetime of the process.
+    """
+
+    try:
+        completed = subprocess.run(
+            [ffmpeg_binary, "-hide_banner", "-encoders"],
+            check=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+    except OSError:
+        return None
+
+    available = {parts[1] for parts in (line.split() for line in completed.stdout.splitlines()) if len(parts) > 1}
+    for encoder in HARDWARE_H264_ENCODERS:
+        if encoder in available and _encoder_works(ffmpeg_binary, encoder):
+            return encoder
+    return None
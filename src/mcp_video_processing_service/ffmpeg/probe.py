@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import subprocess
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
+import orjson
+import redis
 
-def probe_streams(ffprobe_binary: str, media_path: Path) -> dict[str, Any]:
-    """Return structured metadata for the supplied media file."""
+PROBE_CACHE_TTL_SECONDS = 24 * 60 * 60
 
-    command = [
+
+def _probe_command(ffprobe_binary: str, media_path: Path) -> list[str]:
+    return [
         ffprobe_binary,
         "-v",
         "error",
@@ -21,6 +25,12 @@ def probe_streams(ffprobe_binary: str, media_path: Path) -> dict[str, Any]:
         "json",
         str(media_path),
     ]
+
+
+def probe_streams(ffprobe_binary: str, media_path: Path) -> dict[str, Any]:
+    """Return structured metadata for the supplied media file."""
+
+    command = _probe_command(ffprobe_binary, media_path)
     completed = subprocess.run(
         command,
         check=True,
@@ -31,6 +41,55 @@ def probe_streams(ffprobe_binary: str, media_path: Path) -> dict[str, Any]:
     return json.loads(completed.stdout or "{}")
 
 
+def probe_cached(
+    ffprobe_binary: str,
+    media_path: Path,
+    *,
+    cache: redis.Redis,
+    media_id: str,
+    etag: Optional[str],
+    ttl: int = PROBE_CACHE_TTL_SECONDS,
+) -> dict[str, Any]:
+    """Return ffprobe metadata for a PayloadCMS media file, reusing cached results.
+
+    Results are keyed by ``media_id`` and the asset's ETag, so a changed asset is
+    re-probed. Assets served without an ETag are probed uncached: every job downloads
+    a fresh copy, so no local file property identifies the same content twice.
+    """
+
+    if not etag:
+        return probe_streams(ffprobe_binary, media_path)
+    key = f"probe:{media_id}:{etag}"
+
+    cached = cache.get(key)
+    if cached is not None:
+        return orjson.loads(cached)
+
+    metadata = probe_streams(ffprobe_binary, media_path)
+    cache.set(key, orjson.dumps(metadata), ex=ttl)
+    return metadata
+
+
+async def probe_streams_async(ffprobe_binary: str, media_path: Path) -> dict[str, Any]:
+    """Async variant of :func:`probe_streams` that does not block the event loop."""
+
+    command = _probe_command(ffprobe_binary, media_path)
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(
+            process.returncode if process.returncode is not None else -1,
+            command,
+            output=stdout.decode(errors="replace"),
+            stderr=stderr.decode(errors="replace"),
+        )
+    return json.loads(stdout.decode() or "{}")
+
+
 def summarize_media(metadata: dict[str, Any]) -> dict[str, Any]:
     """Extract lightweight summary info for job metadata."""
 
@@ -51,3 +110,42 @@ def summarize_media(metadata: dict[str, Any]) -> dict[str, Any]:
         summary["audioCodec"] = audio_streams[0].get("codec_name")
         summary["audioChannels"] = audio_streams[0].get("channels")
     return summary
+
+
+def matches_geometry(metadata: dict[str, Any], width: int, height: int) -> bool:
+    """Return True when the first video stream is exactly ``width``x``height`` with square pixels."""
+
+    video_streams = [s for s in metadata.get("streams", []) if s.get("codec_type") == "video"]
+    if not video_streams:
+        return False
+    video = video_streams[0]
+    # ffprobe reports "0:1" (or nothing) when the SAR is unspecified, which decoders treat as square.
+    square_pixels = video.get("sample_aspect_ratio") in (None, "0:1", "1:1")
+    return video.get("width") == width and video.get("height") == height and square_pixels
+
+
+def _stream_signature(metadata: dict[str, Any]) -> tuple[Any, ...]:
+    streams = metadata.get("streams", [])
+    video: dict[str, Any] = next((s for s in streams if s.get("codec_type") == "video"), {})
+    audio: dict[str, Any] = next((s for s in streams if s.get("codec_type") == "audio"), {})
+    return (
+        video.get("codec_name"),
+        video.get("profile"),
+        video.get("width"),
+        video.get("height"),
+        video.get("pix_fmt"),
+        video.get("sample_aspect_ratio"),
+        video.get("time_base"),
+        audio.get("codec_name"),
+        audio.get("sample_rate"),
+        audio.get("channels"),
+    )
+
+
+def streams_compatible(metadatas: list[dict[str, Any]]) -> bool:
+    """Return True when all inputs share the codec parameters needed for stream-copy concat."""
+
+    if not metadatas:
+        return False
+    first = _stream_signature(metadatas[0])
+    return first[0] is not None and all(_stream_signature(m) == first for m in metadatas[1:])
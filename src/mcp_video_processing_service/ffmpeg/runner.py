@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import subprocess
 from pathlib import Path
 from typing import Iterable
@@ -30,3 +31,26 @@ def execute_ffmpeg(command: list[str], *, cwd: Path | None = None) -> subprocess
     if completed.returncode != 0:
         raise FFmpegExecutionError(command, completed.stderr)
     return completed
+
+
+async def execute_ffmpeg_async(
+    command: list[str], *, cwd: Path | None = None
+) -> subprocess.CompletedProcess[str]:
+    """Run FFmpeg without blocking the event loop, raising FFmpegExecutionError on failure."""
+
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        cwd=str(cwd) if cwd else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await process.communicate()
+    completed = subprocess.CompletedProcess(
+        command,
+        process.returncode if process.returncode is not None else -1,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
+    if completed.returncode != 0:
+        raise FFmpegExecutionError(command, completed.stderr)
+    return completed
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Literal, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
 
+def utc_now() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+
+    return datetime.now(timezone.utc)
+
+
 class JobStatus(str, Enum):
     """Enumeration of possible job lifecycle states."""
 
@@ -24,7 +30,7 @@ class ProgressSnapshot(BaseModel):
     percent: int = Field(default=0, ge=0, le=100)
     current_step: Optional[str] = Field(default=None)
     message: Optional[str] = Field(default=None)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=utc_now)
 
 
 class ConcatInput(BaseModel):
@@ -99,8 +105,10 @@ class JobRecord(BaseModel):
     result_media_id: Optional[str] = None
     message: Optional[str] = None
     error: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
+
+    model_config = {"frozen": True}
 
 
 class JobCreatedResponse(BaseModel):
@@ -113,6 +121,15 @@ class JobCreatedResponse(BaseModel):
     }
 
 
+MAX_BATCH_STATUS_JOBS = 100
+
+
+class BatchStatusRequest(BaseModel):
+    """HTTP payload for polling several jobs in one request."""
+
+    job_ids: list[str] = Field(min_length=1, max_length=MAX_BATCH_STATUS_JOBS)
+
+
 class JobStatusResponse(BaseModel):
     """Response payload describing the current status of a job."""
 
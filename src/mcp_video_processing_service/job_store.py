@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 import asyncio
-import json
-from datetime import datetime
+import time
+import uuid
 from typing import Any, Callable, Optional
 
+import orjson
 import redis
+from redis.asyncio import BlockingConnectionPool as AsyncBlockingConnectionPool
 from redis.asyncio import Redis as AsyncRedis
 
-from .job_models import JobRecord, JobStatus, ProgressSnapshot
+from .job_models import JobRecord, JobStatus, ProgressSnapshot, utc_now
 
 
 class JobStoreError(RuntimeError):
@@ -23,9 +25,18 @@ class AbstractJobStore:
     async def create_job(self, record: JobRecord) -> None:  # pragma: no cover - interface
         raise NotImplementedError
 
+    async def create_jobs(self, records: list[JobRecord]) -> None:
+        """Persist several new jobs; stores override this to batch the writes."""
+        for record in records:
+            await self.create_job(record)
+
     async def get_job(self, job_id: str) -> Optional[JobRecord]:  # pragma: no cover - interface
         raise NotImplementedError
 
+    async def get_jobs(self, job_ids: list[str]) -> list[Optional[JobRecord]]:
+        """Fetch several jobs, returning ``None`` for unknown IDs in input order."""
+        return [await self.get_job(job_id) for job_id in job_ids]
+
     async def update_job(
         self,
         job_id: str,
@@ -39,6 +50,13 @@ class AbstractJobStore:
     ) -> Optional[JobRecord]:  # pragma: no cover - interface
         raise NotImplementedError
 
+    async def acquire_job_slot(self, limit: int) -> bool:  # pragma: no cover - interface
+        """Reserve one of ``limit`` in-flight job slots, returning False when all are taken."""
+        raise NotImplementedError
+
+    async def release_job_slot(self) -> None:  # pragma: no cover - interface
+        raise NotImplementedError
+
     async def close(self) -> None:  # pragma: no cover - interface
         """Release any allocated resources."""
         return None
@@ -49,16 +67,26 @@ class InMemoryJobStore(AbstractJobStore):
 
     def __init__(self) -> None:
         self._records: dict[str, JobRecord] = {}
+        self._inflight_jobs = 0
         self._lock = asyncio.Lock()
 
     async def create_job(self, record: JobRecord) -> None:
         async with self._lock:
             self._records[record.job_id] = record
 
+    async def create_jobs(self, records: list[JobRecord]) -> None:
+        async with self._lock:
+            for record in records:
+                self._records[record.job_id] = record
+
     async def get_job(self, job_id: str) -> Optional[JobRecord]:
         async with self._lock:
-            record = self._records.get(job_id)
-            return record.model_copy(deep=True) if record else None
+            # Records are frozen, so they can be shared without copying.
+            return self._records.get(job_id)
+
+    async def get_jobs(self, job_ids: list[str]) -> list[Optional[JobRecord]]:
+        async with self._lock:
+            return [self._records.get(job_id) for job_id in job_ids]
 
     async def update_job(
         self,
@@ -77,7 +105,7 @@ class InMemoryJobStore(AbstractJobStore):
                 return None
 
             update_data: dict[str, Any] = {
-                "updated_at": datetime.utcnow(),
+                "updated_at": utc_now(),
             }
             if status is not None:
                 update_data["status"] = status
@@ -95,7 +123,18 @@ class InMemoryJobStore(AbstractJobStore):
 
             new_record = record.model_copy(update=update_data)
             self._records[job_id] = new_record
-            return new_record.model_copy(deep=True)
+            return new_record
+
+    async def acquire_job_slot(self, limit: int) -> bool:
+        async with self._lock:
+            if self._inflight_jobs >= limit:
+                return False
+            self._inflight_jobs += 1
+            return True
+
+    async def release_job_slot(self) -> None:
+        async with self._lock:
+            self._inflight_jobs = max(0, self._inflight_jobs - 1)
 
     async def close(self) -> None:
         self._records.clear()
@@ -105,23 +144,184 @@ def _job_key(job_id: str) -> str:
     return f"video-job:{job_id}"
 
 
+# Records are stored as a Redis hash with one field per JobRecord attribute.
+# Scalars are kept as plain strings; only these fields hold JSON documents.
+_JSON_FIELDS = frozenset({"params", "progress"})
+# Each metadata entry is its own JSON-encoded hash field, so a metadata patch
+# merges with a plain HSET and values are never re-encoded by Lua's cjson.
+_METADATA_PREFIX = "metadata:"
+
+
+# Applies the supplied field/value pairs only if the job exists, so concurrent
+# writers (API and workers) cannot resurrect deleted jobs and each update costs
+# a single round trip.
+_UPDATE_JOB_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+redis.call('HSET', KEYS[1], unpack(ARGV))
+return redis.call('HGETALL', KEYS[1])
+"""
+
+
+# Leases of admitted jobs not yet finished by a worker, shared by all API processes.
+# Each lease is scored by its expiry so slots leaked by crashed workers are reclaimed.
+_INFLIGHT_KEY = "video-job:slots"
+DEFAULT_SLOT_TTL_SECONDS = 3600
+
+_ACQUIRE_SLOT_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[2])
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], tonumber(ARGV[2]) + tonumber(ARGV[3]), ARGV[4])
+return 1
+"""
+
+
+def _encode_fields(data: dict[str, Any]) -> dict[str, str]:
+    fields: dict[str, str] = {}
+    for name, value in data.items():
+        if value is None:
+            continue
+        if name == "metadata":
+            fields.update(_encode_metadata(value))
+        elif name in _JSON_FIELDS:
+            fields[name] = orjson.dumps(value, default=str).decode()
+        else:
+            fields[name] = str(value)
+    return fields
+
+
+def _encode_metadata(metadata: dict[str, Any]) -> dict[str, str]:
+    return {
+        f"{_METADATA_PREFIX}{key}": orjson.dumps(value, default=str).decode()
+        for key, value in metadata.items()
+    }
+
+
+def _decode_fields(fields: dict[bytes, bytes]) -> JobRecord:
+    data: dict[str, Any] = {}
+    metadata: dict[str, Any] = {}
+    for raw_name, value in fields.items():
+        name = raw_name.decode()
+        # orjson parses the raw bytes directly; only scalars need decoding.
+        if name.startswith(_METADATA_PREFIX):
+            metadata[name[len(_METADATA_PREFIX):]] = orjson.loads(value)
+        elif name in _JSON_FIELDS:
+            data[name] = orjson.loads(value)
+        else:
+            data[name] = value.decode()
+    data["metadata"] = metadata
+    return JobRecord.model_validate(data)
+
+
+def _decode_script_reply(reply: Optional[list[bytes]]) -> Optional[JobRecord]:
+    if not reply:
+        return None
+    return _decode_fields(dict(zip(reply[::2], reply[1::2], strict=True)))
+
+
+def _build_update_args(
+    *,
+    status: Optional[JobStatus],
+    progress: Optional[ProgressSnapshot],
+    result_media_id: Optional[str],
+    message: Optional[str],
+    error: Optional[str],
+    metadata: Optional[dict[str, Any]],
+) -> list[str]:
+    changes: dict[str, Any] = {
+        "updated_at": utc_now().isoformat(),
+        "status": status.value if status is not None else None,
+        "progress": progress.model_dump(mode="json") if progress is not None else None,
+        "result_media_id": result_media_id,
+        "message": message,
+        "error": error,
+    }
+    fields = _encode_fields(changes)
+    if metadata is not None:
+        fields.update(_encode_metadata(metadata))
+    return [item for pair in fields.items() for item in pair]
+
+
+# Seconds a caller waits for a free pooled connection before Redis raises.
+_POOL_TIMEOUT_SECONDS = 5
+
+_SYNC_POOLS: dict[tuple[str, Optional[int]], redis.ConnectionPool] = {}
+
+
+def _sync_connection_pool(redis_url: str, max_connections: Optional[int]) -> redis.ConnectionPool:
+    """Return the process-wide pool for ``redis_url`` so tasks reuse connections.
+
+    A sized pool blocks callers until a connection frees up instead of failing
+    with "Too many connections"; without a size the pool grows on demand.
+    """
+
+    key = (redis_url, max_connections)
+    pool = _SYNC_POOLS.get(key)
+    if pool is None:
+        if max_connections is None:
+            pool = redis.ConnectionPool.from_url(redis_url)
+        else:
+            pool = redis.BlockingConnectionPool.from_url(
+                redis_url, max_connections=max_connections, timeout=_POOL_TIMEOUT_SECONDS
+            )
+        _SYNC_POOLS[key] = pool
+    return pool
+
+
+def get_sync_redis(redis_url: str, max_connections: Optional[int] = None) -> redis.Redis:
+    """Return a blocking client backed by the shared process-wide pool for ``redis_url``."""
+
+    return redis.Redis(connection_pool=_sync_connection_pool(redis_url, max_connections))
+
+
 class RedisJobStore(AbstractJobStore):
     """Redis-backed store for use by the FastAPI service."""
 
-    def __init__(self, redis_url: str) -> None:
-        self._redis = AsyncRedis.from_url(redis_url, decode_responses=True)
+    def __init__(
+        self,
+        redis_url: str,
+        *,
+        max_connections: Optional[int] = None,
+        slot_ttl: float = DEFAULT_SLOT_TTL_SECONDS,
+    ) -> None:
+        self._slot_ttl = slot_ttl
+        if max_connections is None:
+            self._redis = AsyncRedis.from_url(redis_url)
+        else:
+            self._redis = AsyncRedis(
+                connection_pool=AsyncBlockingConnectionPool.from_url(
+                    redis_url, max_connections=max_connections, timeout=_POOL_TIMEOUT_SECONDS
+                )
+            )
+        self._update_script = self._redis.register_script(_UPDATE_JOB_LUA)
+        self._acquire_slot_script = self._redis.register_script(_ACQUIRE_SLOT_LUA)
 
     async def create_job(self, record: JobRecord) -> None:
-        payload = record.model_dump(mode="json")
-        payload_json = json.dumps(payload, default=str)
-        await self._redis.set(_job_key(record.job_id), payload_json)
+        fields = _encode_fields(record.model_dump(mode="json"))
+        await self._redis.hset(_job_key(record.job_id), mapping=fields)
+
+    async def create_jobs(self, records: list[JobRecord]) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for record in records:
+                fields = _encode_fields(record.model_dump(mode="json"))
+                pipe.hset(_job_key(record.job_id), mapping=fields)
+            await pipe.execute()
 
     async def get_job(self, job_id: str) -> Optional[JobRecord]:
-        raw = await self._redis.get(_job_key(job_id))
-        if raw is None:
+        fields = await self._redis.hgetall(_job_key(job_id))
+        if not fields:
             return None
-        data = json.loads(raw)
-        return JobRecord.model_validate(data)
+        return _decode_fields(fields)
+
+    async def get_jobs(self, job_ids: list[str]) -> list[Optional[JobRecord]]:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for job_id in job_ids:
+                pipe.hgetall(_job_key(job_id))
+            results = await pipe.execute()
+        return [_decode_fields(fields) if fields else None for fields in results]
 
     async def update_job(
         self,
@@ -134,59 +334,48 @@ class RedisJobStore(AbstractJobStore):
         error: Optional[str] = None,
         metadata: Optional[dict[str, Any]] = None,
     ) -> Optional[JobRecord]:
-        async with self._redis.pipeline() as pipe:
-            key = _job_key(job_id)
-            await pipe.get(key)
-            result = await pipe.execute()
-        raw = result[0]
-        if raw is None:
-            return None
-
-        data = json.loads(raw)
-        record = JobRecord.model_validate(data)
-
-        update_data: dict[str, Any] = {
-            "updated_at": datetime.utcnow(),
-        }
-        if status is not None:
-            update_data["status"] = status
-        if progress is not None:
-            update_data["progress"] = progress
-        if result_media_id is not None:
-            update_data["result_media_id"] = result_media_id
-        if message is not None:
-            update_data["message"] = message
-        if error is not None:
-            update_data["error"] = error
-        if metadata is not None:
-            merged = {**record.metadata, **metadata}
-            update_data["metadata"] = merged
-
-        updated = record.model_copy(update=update_data)
-        await self._redis.set(key, json.dumps(updated.model_dump(mode="json"), default=str))
-        return updated
+        reply = await self._update_script(
+            keys=[_job_key(job_id)],
+            args=_build_update_args(
+                status=status,
+                progress=progress,
+                result_media_id=result_media_id,
+                message=message,
+                error=error,
+                metadata=metadata,
+            ),
+        )
+        return _decode_script_reply(reply)
+
+    async def acquire_job_slot(self, limit: int) -> bool:
+        lease = [limit, time.time(), self._slot_ttl, uuid.uuid4().hex]
+        return bool(await self._acquire_slot_script(keys=[_INFLIGHT_KEY], args=lease))
+
+    async def release_job_slot(self) -> None:
+        # Leases are interchangeable, so the one closest to expiring is dropped.
+        await self._redis.zpopmin(_INFLIGHT_KEY)
 
     async def close(self) -> None:
-        await self._redis.close()
+        await self._redis.aclose()
         await self._redis.connection_pool.disconnect()
 
 
 class RedisJobStoreSync:
     """Synchronous Redis store variant for use by Celery workers."""
 
-    def __init__(self, redis_url: str) -> None:
-        self._redis = redis.Redis.from_url(redis_url, decode_responses=True)
+    def __init__(self, redis_url: str, *, max_connections: Optional[int] = None) -> None:
+        self._redis = get_sync_redis(redis_url, max_connections)
+        self._update_script = self._redis.register_script(_UPDATE_JOB_LUA)
 
     def create_job(self, record: JobRecord) -> None:
-        payload = json.dumps(record.model_dump(mode="json"), default=str)
-        self._redis.set(_job_key(record.job_id), payload)
+        fields = _encode_fields(record.model_dump(mode="json"))
+        self._redis.hset(_job_key(record.job_id), mapping=fields)
 
     def get_job(self, job_id: str) -> Optional[JobRecord]:
-        raw = self._redis.get(_job_key(job_id))
-        if raw is None:
+        fields = self._redis.hgetall(_job_key(job_id))
+        if not fields:
             return None
-        data = json.loads(raw)
-        return JobRecord.model_validate(data)
+        return _decode_fields(fields)
 
     def update_job(
         self,
@@ -199,34 +388,21 @@ class RedisJobStoreSync:
         error: Optional[str] = None,
         metadata: Optional[dict[str, Any]] = None,
     ) -> Optional[JobRecord]:
-        pipe = self._redis.pipeline()
-        key = _job_key(job_id)
-        pipe.get(key)
-        raw = pipe.execute()[0]
-        if raw is None:
-            return None
-        record = JobRecord.model_validate(json.loads(raw))
-
-        update_data: dict[str, Any] = {
-            "updated_at": datetime.utcnow(),
-        }
-        if status is not None:
-            update_data["status"] = status
-        if progress is not None:
-            update_data["progress"] = progress
-        if result_media_id is not None:
-            update_data["result_media_id"] = result_media_id
-        if message is not None:
-            update_data["message"] = message
-        if error is not None:
-            update_data["error"] = error
-        if metadata is not None:
-            merged = {**record.metadata, **metadata}
-            update_data["metadata"] = merged
-
-        updated = record.model_copy(update=update_data)
-        self._redis.set(key, json.dumps(updated.model_dump(mode="json"), default=str))
-        return updated
+        reply = self._update_script(
+            keys=[_job_key(job_id)],
+            args=_build_update_args(
+                status=status,
+                progress=progress,
+                result_media_id=result_media_id,
+                message=message,
+                error=error,
+                metadata=metadata,
+            ),
+        )
+        return _decode_script_reply(reply)
+
+    def release_job_slot(self) -> None:
+        self._redis.zpopmin(_INFLIGHT_KEY)
 
 
 JobStoreFactory = Callable[[], RedisJobStoreSync]
@@ -4,13 +4,18 @@ from __future__ import annotations
 
 import logging
 import structlog
+import uvicorn
 from contextlib import asynccontextmanager
+from functools import partial
 from typing import Optional
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-from .api.routes import router as api_router
+from .admission import AdmissionController, admission_middleware
+from .api.routes import JobSubmission, persist_and_enqueue, router as api_router
+from .batching import DynBatcher
 from .celery_app import celery_app
 from .config import settings
 from .job_store import AbstractJobStore, InMemoryJobStore, RedisJobStore
@@ -47,14 +52,32 @@ def create_app(job_store: Optional[AbstractJobStore] = None) -> FastAPI:
         nonlocal selected_job_store
         if selected_job_store is None:
             try:
-                selected_job_store = RedisJobStore(settings.redis_url)
+                selected_job_store = RedisJobStore(
+                    settings.redis_url,
+                    max_connections=settings.redis_max_connections,
+                    slot_ttl=settings.inflight_slot_ttl_seconds,
+                )
             except Exception:  # pragma: no cover - defensive fallback
                 logger.warning("Falling back to in-memory job store")
                 selected_job_store = InMemoryJobStore()
 
         app.state.job_store = selected_job_store
         app.state.celery_app = celery_app
+        submission_batcher: DynBatcher[JobSubmission] = DynBatcher(
+            partial(persist_and_enqueue, selected_job_store),
+            max_batch_size=settings.submit_batch_max_size,
+            max_delay=settings.submit_batch_max_delay_seconds,
+        )
+        submission_batcher.start()
+        app.state.submission_batcher = submission_batcher
+        if settings.max_inflight_jobs:
+            app.state.admission = AdmissionController(
+                selected_job_store,
+                max_inflight_jobs=settings.max_inflight_jobs,
+                queue_timeout=settings.admission_queue_timeout_seconds,
+            )
         yield
+        await submission_batcher.stop()
         if selected_job_store:
             await selected_job_store.close()
 
@@ -65,8 +88,11 @@ def create_app(job_store: Optional[AbstractJobStore] = None) -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
+    # Middleware added last runs first; CORS must wrap admission so its 503s carry CORS headers.
+    app.middleware("http")(admission_middleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -89,3 +115,21 @@ def create_app(job_store: Optional[AbstractJobStore] = None) -> FastAPI:
 
 
 app = create_app()
+
+
+def run() -> None:
+    """Serve the API across ``VIDEO_API_WORKERS`` processes.
+
+    uvicorn's ``auto`` settings use uvloop and httptools where they are installed
+    (uvloop is not available on Windows) and fall back to asyncio and h11 otherwise.
+    """
+
+    uvicorn.run(
+        "mcp_video_processing_service.main:app",
+        host=settings.api_host,
+        port=settings.api_port,
+        workers=settings.api_workers,
+        loop="auto",
+        http="auto",
+        log_level=settings.log_level.lower(),
+    )
@@ -2,15 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import re
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Sequence
 
 import httpx
+import orjson
+import redis
 
 logger = logging.getLogger(__name__)
 
+_DOWNLOAD_CHUNK = 1 << 20
+_SMALL_DOWNLOAD_CHUNK = 512 * 1024
+_LARGE_DOWNLOAD_CHUNK = 2 << 20
+_MEDIA_CACHE_MAX_ENTRIES = 1024
+# Upper bound on concurrent fetch-and-download pipelines for one batch.
+MAX_PARALLEL_DOWNLOADS = 8
+_SAFE_NAME = re.compile(r"[A-Za-z0-9_-][A-Za-z0-9._-]*")
+_SAFE_SUFFIX = re.compile(r"\.[A-Za-z0-9]{1,16}")
+
 
 @dataclass(slots=True)
 class MediaAsset:
@@ -20,10 +36,84 @@ class MediaAsset:
     filename: str
     mime_type: str
     download_url: str
+    etag: Optional[str] = None
+
+    @property
+    def local_filename(self) -> str:
+        """Filename for the local copy, keyed by media id so distinct assets never collide.
+
+        Ids that are not plain tokens (path separators, ``..``) are hashed so the copy
+        always lands inside the job directory.
+        """
+
+        stem = self.media_id
+        if not _SAFE_NAME.fullmatch(stem):
+            stem = hashlib.sha256(stem.encode()).hexdigest()
+        suffix = Path(self.filename).suffix
+        return f"{stem}{suffix}" if _SAFE_SUFFIX.fullmatch(suffix) else stem
+
+
+class _LocalMediaCache:
+    """Short-lived in-process media metadata cache."""
+
+    def __init__(self, ttl: int) -> None:
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, MediaAsset]] = OrderedDict()
+
+    def get(self, media_id: str) -> Optional[MediaAsset]:
+        if not self.ttl:
+            return None
+        entry = self._entries.get(media_id)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[media_id]
+            return None
+        self._entries.move_to_end(media_id)
+        return entry[1]
+
+    def put(self, asset: MediaAsset) -> None:
+        if not self.ttl:
+            return
+        self._entries[asset.media_id] = (time.monotonic() + self.ttl, asset)
+        self._entries.move_to_end(asset.media_id)
+        while len(self._entries) > _MEDIA_CACHE_MAX_ENTRIES:
+            self._entries.popitem(last=False)
+
+
+class _MediaCache:
+    """Short-lived media metadata cache: in-process entries backed by Redis."""
+
+    def __init__(self, redis_client: Optional[redis.Redis], ttl: int) -> None:
+        self._redis = redis_client
+        self.local = _LocalMediaCache(ttl)
+
+    def get(self, media_id: str) -> Optional[MediaAsset]:
+        asset = self.local.get(media_id)
+        if asset is not None or self._redis is None or not self.local.ttl:
+            return asset
+        raw = self._redis.get(f"media:{media_id}")
+        if raw is None:
+            return None
+        asset = MediaAsset(**orjson.loads(raw))
+        self.local.put(asset)
+        return asset
+
+    def put(self, asset: MediaAsset) -> None:
+        if not self.local.ttl:
+            return
+        self.local.put(asset)
+        if self._redis is not None:
+            self._redis.setex(f"media:{asset.media_id}", self.local.ttl, orjson.dumps(asset))
 
 
 class PayloadMediaClient:
-    """Blocking client for managing PayloadCMS media assets."""
+    """Blocking client for managing PayloadCMS media assets.
+
+    A single HTTP/2-capable ``httpx.Client`` is kept for the lifetime of the
+    instance so consecutive calls reuse keep-alive connections. Call ``close`` (or use the
+    client as a context manager) to release them.
+    """
 
     def __init__(
         self,
@@ -32,69 +122,271 @@ class PayloadMediaClient:
         api_token: Optional[str] = None,
         timeout: float = 30.0,
         verify: bool = True,
+        max_connections: int = 32,
+        max_keepalive_connections: int = 16,
+        cache: Optional[redis.Redis] = None,
+        cache_ttl: int = 0,
+        transport: Optional[httpx.BaseTransport] = None,
     ) -> None:
         self._base_url = base_url.rstrip("/") if base_url else ""
         self._api_token = api_token
         self._timeout = timeout
         self._verify = verify
+        self._headers = _default_headers(api_token)
+        self._media_cache = _MediaCache(cache, cache_ttl)
+        # Reused for batch downloads when it can also serve async requests (e.g. MockTransport).
+        self._async_transport = (
+            transport if isinstance(transport, httpx.AsyncBaseTransport) else None
+        )
+        self._client = httpx.Client(
+            base_url=self._base_url,
+            headers=self._headers,
+            timeout=timeout,
+            verify=verify,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            transport=transport,
+        )
+
+    def __enter__(self) -> "PayloadMediaClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled connections held by the client."""
 
-    def _headers(self) -> dict[str, str]:
-        headers = {"Accept": "application/json"}
-        if self._api_token:
-            headers["Authorization"] = f"Bearer {self._api_token}"
-        return headers
+        self._client.close()
 
     def fetch_media(self, media_id: str) -> MediaAsset:
         """Retrieve metadata for a media asset."""
 
-        url = f"{self._base_url}/media/{media_id}"
-        with httpx.Client(timeout=self._timeout, verify=self._verify) as client:
-            response = client.get(url, headers=self._headers())
+        asset = self._media_cache.get(media_id)
+        if asset is None:
+            response = self._client.get(f"/media/{media_id}")
             response.raise_for_status()
-            data = response.json()
-
-        download_url = data.get("directDownloadUrl") or data.get("url")
-        if not download_url:
-            raise ValueError("PayloadCMS response missing download URL")
-
-        return MediaAsset(
-            media_id=media_id,
-            filename=data.get("filename") or data.get("originalFilename", media_id),
-            mime_type=data.get("mimeType") or data.get("mimetype", "application/octet-stream"),
-            download_url=download_url,
-        )
+            asset = _asset_from_response(media_id, response)
+            self._media_cache.put(asset)
+        return asset
 
     def download_media(self, asset: MediaAsset, destination: Path) -> None:
         """Download a media asset to the specified destination path."""
 
         destination.parent.mkdir(parents=True, exist_ok=True)
-        with httpx.Client(timeout=self._timeout, verify=self._verify) as client:
-            with client.stream("GET", asset.download_url, headers=self._headers()) as response:
-                response.raise_for_status()
-                with destination.open("wb") as output_file:
-                    for chunk in response.iter_bytes():
-                        output_file.write(chunk)
+        with self._client.stream("GET", asset.download_url) as response:
+            response.raise_for_status()
+            chunk_size = _pick_chunk(response)
+            with destination.open("wb", buffering=chunk_size) as output_file:
+                output_file.writelines(response.iter_bytes(chunk_size=chunk_size))
+
+    def fetch_and_download_many(
+        self,
+        media_ids: Sequence[str],
+        directory: Path,
+        *,
+        on_downloaded: Optional[Callable[[MediaAsset, Path], None]] = None,
+    ) -> list[tuple[MediaAsset, Path]]:
+        """Fetch and download several assets concurrently into ``directory``.
+
+        Runs ``AsyncPayloadMediaClient.fetch_and_download_many`` on a private event
+        loop. Redis-cached metadata is loaded before the loop starts and newly fetched
+        metadata is stored after it ends, so the loop itself never blocks on Redis.
+        """
+
+        unique_ids = list(dict.fromkeys(media_ids))
+        cached_ids = {
+            media_id for media_id in unique_ids if self._media_cache.get(media_id) is not None
+        }
+
+        async def run() -> list[tuple[MediaAsset, Path]]:
+            async with AsyncPayloadMediaClient(
+                self._base_url,
+                api_token=self._api_token,
+                timeout=self._timeout,
+                verify=self._verify,
+                max_connections=min(MAX_PARALLEL_DOWNLOADS, len(unique_ids)) or 1,
+                media_cache=self._media_cache.local,
+                transport=self._async_transport,
+            ) as client:
+                return await client.fetch_and_download_many(
+                    media_ids, directory, on_downloaded=on_downloaded
+                )
+
+        downloads = asyncio.run(run())
+        for asset, _ in downloads:
+            if asset.media_id not in cached_ids:
+                cached_ids.add(asset.media_id)
+                self._media_cache.put(asset)
+        return downloads
 
     def upload_media(self, file_path: Path, metadata: dict[str, Any]) -> dict[str, Any]:
         """Upload processed media back to PayloadCMS."""
 
-        url = f"{self._base_url}/media"
-        data: Dict[str, Any] = {k: str(v) for k, v in metadata.items() if k != "mimeType"}
+        data, mime_type = _upload_fields(metadata)
+        with file_path.open("rb") as file_handle:
+            # The multipart body reads the open handle in chunks as it is sent,
+            # so large renders never sit in memory.
+            request = self._client.build_request(
+                "POST", "/media", data=data, files={"file": (file_path.name, file_handle, mime_type)}
+            )
+            response = self._client.send(request)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+
+class AsyncPayloadMediaClient:
+    """Asynchronous counterpart of ``PayloadMediaClient`` built on ``httpx.AsyncClient``.
+
+    Use it as an async context manager (or call ``aclose``) so its pooled
+    connections are released on the event loop that opened them. Metadata is only
+    cached in process; ``media_cache`` lets a caller share its cache with the client.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        api_token: Optional[str] = None,
+        timeout: float = 30.0,
+        verify: bool = True,
+        max_connections: int = 32,
+        max_keepalive_connections: int = 16,
+        cache_ttl: int = 0,
+        media_cache: Optional[_LocalMediaCache] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self._media_cache = media_cache if media_cache is not None else _LocalMediaCache(cache_ttl)
+        self._client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/") if base_url else "",
+            headers=_default_headers(api_token),
+            timeout=timeout,
+            verify=verify,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "AsyncPayloadMediaClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close pooled connections held by the client."""
+
+        await self._client.aclose()
+
+    async def fetch_media(self, media_id: str) -> MediaAsset:
+        """Retrieve metadata for a media asset."""
+
+        asset = self._media_cache.get(media_id)
+        if asset is None:
+            response = await self._client.get(f"/media/{media_id}")
+            response.raise_for_status()
+            asset = _asset_from_response(media_id, response)
+            self._media_cache.put(asset)
+        return asset
+
+    async def download_media(self, asset: MediaAsset, destination: Path) -> None:
+        """Download a media asset to the specified destination path."""
+
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        async with self._client.stream("GET", asset.download_url) as response:
+            response.raise_for_status()
+            chunk_size = _pick_chunk(response)
+            with destination.open("wb", buffering=chunk_size) as output_file:
+                async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                    output_file.write(chunk)
+
+    async def fetch_and_download_many(
+        self,
+        media_ids: Sequence[str],
+        directory: Path,
+        *,
+        on_downloaded: Optional[Callable[[MediaAsset, Path], None]] = None,
+    ) -> list[tuple[MediaAsset, Path]]:
+        """Fetch and download several assets concurrently into ``directory``.
+
+        Each distinct media id is fetched and downloaded once, at most
+        ``MAX_PARALLEL_DOWNLOADS`` at a time; results follow the order of ``media_ids``.
+        ``on_downloaded`` is called on the event loop with the asset and its local path
+        as each download finishes, so it must not block.
+        """
+
+        directory.mkdir(parents=True, exist_ok=True)
+        unique_ids = list(dict.fromkeys(media_ids))
+        limiter = asyncio.Semaphore(MAX_PARALLEL_DOWNLOADS)
+
+        async def fetch_and_download(media_id: str) -> tuple[MediaAsset, Path]:
+            async with limiter:
+                asset = await self.fetch_media(media_id)
+                destination = directory / asset.local_filename
+                await self.download_media(asset, destination)
+            if on_downloaded is not None:
+                on_downloaded(asset, destination)
+            return asset, destination
 
+        results = await asyncio.gather(*(fetch_and_download(media_id) for media_id in unique_ids))
+        by_id = dict(zip(unique_ids, results, strict=True))
+        return [by_id[media_id] for media_id in media_ids]
+
+    async def upload_media(self, file_path: Path, metadata: dict[str, Any]) -> dict[str, Any]:
+        """Upload processed media back to PayloadCMS."""
+
+        data, mime_type = _upload_fields(metadata)
         with file_path.open("rb") as file_handle:
-            files = {
-                "file": (
-                    file_path.name,
-                    file_handle,
-                    metadata.get("mimeType", "video/mp4"),
-                )
-            }
-            with httpx.Client(timeout=self._timeout, verify=self._verify) as client:
-                response = client.post(
-                    url,
-                    headers=self._headers(),
-                    data=data,
-                    files=files,
-                )
-                response.raise_for_status()
-                return response.json()
+            request = self._client.build_request(
+                "POST", "/media", data=data, files={"file": (file_path.name, file_handle, mime_type)}
+            )
+            response = await self._client.send(request)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+
+def _default_headers(api_token: Optional[str]) -> dict[str, str]:
+    headers = {"Accept": "application/json"}
+    if api_token:
+        headers["Authorization"] = f"Bearer {api_token}"
+    return headers
+
+
+def _upload_fields(metadata: dict[str, Any]) -> tuple[Dict[str, Any], str]:
+    data: Dict[str, Any] = {k: str(v) for k, v in metadata.items() if k != "mimeType"}
+    return data, metadata.get("mimeType", "video/mp4")
+
+
+def _pick_chunk(response: httpx.Response) -> int:
+    """Choose a download chunk size from the response's Content-Length."""
+
+    try:
+        total = int(response.headers["Content-Length"])
+    except (KeyError, ValueError):
+        return _DOWNLOAD_CHUNK
+    if total < 10 * _DOWNLOAD_CHUNK:
+        return _SMALL_DOWNLOAD_CHUNK
+    if total > 100 * _DOWNLOAD_CHUNK:
+        return _LARGE_DOWNLOAD_CHUNK
+    return _DOWNLOAD_CHUNK
+
+
+def _asset_from_response(media_id: str, response: httpx.Response) -> MediaAsset:
+    data = orjson.loads(response.content)
+    download_url = data.get("directDownloadUrl") or data.get("url")
+    if not download_url:
+        raise ValueError("PayloadCMS response missing download URL")
+
+    return MediaAsset(
+        media_id=media_id,
+        filename=data.get("filename") or data.get("originalFilename", media_id),
+        mime_type=data.get("mimeType") or data.get("mimetype", "application/octet-stream"),
+        download_url=download_url,
+        etag=response.headers.get("ETag") or data.get("updatedAt"),
+    )
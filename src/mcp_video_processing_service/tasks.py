@@ -2,28 +2,44 @@
 
 from __future__ import annotations
 
-import json
 import logging
-import tempfile
+import os
+import shutil
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable, Optional
 from uuid import uuid4
 
+import orjson
 from celery import Task
+from celery.signals import task_postrun, worker_process_init, worker_process_shutdown
 
 from .celery_app import celery_app
-from .config import settings
+from .config import runtime_settings as settings
 from .ffmpeg.command_builder import (
+    SOFTWARE_VIDEO_ENCODER,
+    TARGET_HEIGHT,
+    TARGET_WIDTH,
+    ConcatSegment,
     build_concat_command,
     build_overlay_command,
     build_overlay_filter,
+    build_trim_concat_command,
     generate_concat_filelist,
 )
-from .ffmpeg.probe import probe_streams, summarize_media
+from .ffmpeg.hwaccel import detect_hardware_encoder
+from .ffmpeg.probe import (
+    matches_geometry,
+    probe_cached,
+    probe_streams,
+    streams_compatible,
+    summarize_media,
+)
 from .ffmpeg.runner import FFmpegExecutionError, execute_ffmpeg
 from .job_models import JobStatus, ProgressSnapshot
-from .job_store import JobStoreFactory, RedisJobStoreSync
-from .payload_client import MediaAsset, PayloadMediaClient
+from .job_store import JobStoreFactory, RedisJobStoreSync, get_sync_redis
+from .payload_client import MAX_PARALLEL_DOWNLOADS, MediaAsset, PayloadMediaClient
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +49,8 @@ PayloadClientProvider = Callable[[], PayloadMediaClient]
 
 _job_store_provider: Optional[JobStoreProvider] = None
 _payload_client_provider: Optional[PayloadClientProvider] = None
+_cached_payload_client: Optional[tuple[int, PayloadMediaClient]] = None
+_cached_temp_root: Optional[tuple[int, Path]] = None
 
 
 def set_job_store_provider(provider: JobStoreProvider) -> None:
@@ -52,19 +70,108 @@ def set_payload_client_provider(provider: PayloadClientProvider) -> None:
 def _get_job_store() -> RedisJobStoreSync:
     if _job_store_provider:
         return _job_store_provider()
-    return RedisJobStoreSync(settings.redis_url)
+    return RedisJobStoreSync(settings.redis_url, max_connections=settings.redis_max_connections)
 
 
 def _get_payload_client() -> PayloadMediaClient:
+    global _cached_payload_client
     if _payload_client_provider:
         return _payload_client_provider()
     if not settings.payload_base_url:
         raise RuntimeError("PayloadCMS base URL not configured")
-    return PayloadMediaClient(
-        settings.payload_base_url,
-        api_token=settings.payload_api_token,
-        timeout=settings.request_timeout_seconds,
-    )
+    # Keep one client per worker process so tasks share keep-alive connections;
+    # the pid check stops a forked child from reusing its parent's sockets.
+    pid = os.getpid()
+    if _cached_payload_client is None or _cached_payload_client[0] != pid:
+        client = PayloadMediaClient(
+            settings.payload_base_url,
+            api_token=settings.payload_api_token,
+            timeout=settings.request_timeout_seconds,
+            cache=get_sync_redis(settings.redis_url, settings.redis_max_connections),
+            cache_ttl=settings.payload_media_cache_ttl_seconds,
+        )
+        _cached_payload_client = (pid, client)
+    return _cached_payload_client[1]
+
+
+@worker_process_shutdown.connect
+def _close_payload_client(**_: Any) -> None:
+    global _cached_payload_client
+    if _cached_payload_client is not None and _cached_payload_client[0] == os.getpid():
+        _cached_payload_client[1].close()
+    _cached_payload_client = None
+
+
+def _ffmpeg_threads() -> int:
+    if settings.ffmpeg_threads_per_invocation:
+        return settings.ffmpeg_threads_per_invocation
+    cpu_count = os.cpu_count() or 1
+    # Unset concurrency means Celery's default of one worker process per CPU.
+    return max(1, cpu_count // (settings.celery_worker_concurrency or cpu_count))
+
+
+def _video_encoder() -> str:
+    if settings.hardware_encoding:
+        return detect_hardware_encoder(settings.ffmpeg_binary) or SOFTWARE_VIDEO_ENCODER
+    return SOFTWARE_VIDEO_ENCODER
+
+
+def _at_target_geometry(metadata: dict[str, Any]) -> bool:
+    return matches_geometry(metadata, TARGET_WIDTH, TARGET_HEIGHT)
+
+
+def _video_codec(metadata: dict[str, Any]) -> Optional[str]:
+    for stream in metadata.get("streams", []):
+        if stream.get("codec_type") == "video":
+            return stream.get("codec_name")
+    return None
+
+
+def _can_stream_copy(probes: list[dict[str, Any]]) -> bool:
+    """Return True when the inputs can be joined by remuxing instead of re-encoding."""
+
+    return streams_compatible(probes) and _video_codec(probes[0]) == "h264"
+
+
+class _ProgressBatcher:
+    """Coalesce a task's job updates into as few Redis writes as possible.
+
+    Updates are written straight away when they change the status, set another
+    top-level field or start a new progress step. Further snapshots for the same
+    step, and ``metadata`` (merged key by key across calls), are written at most
+    once per ``min_interval`` seconds; ``flush`` writes whatever is still pending.
+    """
+
+    def __init__(self, job_store: RedisJobStoreSync, job_id: str, *, min_interval: float = 0.5) -> None:
+        self._job_store = job_store
+        self._job_id = job_id
+        self._min_interval = min_interval
+        self._pending: dict[str, Any] = {}
+        self._last_step: Optional[str] = None
+        self._last_flush = float("-inf")
+
+    def update(self, **fields: Any) -> None:
+        metadata = fields.pop("metadata", None)
+        if metadata is not None:
+            self._pending["metadata"] = {**self._pending.get("metadata", {}), **metadata}
+        self._pending.update(fields)
+
+        progress: Optional[ProgressSnapshot] = fields.get("progress")
+        urgent = (
+            any(key != "progress" for key in fields)
+            or (progress is not None and progress.current_step != self._last_step)
+        )
+        if urgent or time.monotonic() - self._last_flush >= self._min_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        if "progress" in pending:
+            self._last_step = pending["progress"].current_step
+        self._job_store.update_job(self._job_id, **pending)
+        self._last_flush = time.monotonic()
 
 
 def _progress(percent: int, step: str, message: str) -> ProgressSnapshot:
@@ -75,15 +182,117 @@ def _safe_metadata(metadata: dict[str, Any]) -> dict[str, Any]:
     return {k: v for k, v in metadata.items() if v is not None}
 
 
+def _probe_media(ffprobe_binary: str, asset: MediaAsset, path: Path) -> dict[str, Any]:
+    return probe_cached(
+        ffprobe_binary,
+        path,
+        cache=get_sync_redis(settings.redis_url, settings.redis_max_connections),
+        media_id=asset.media_id,
+        etag=asset.etag,
+    )
+
+
 def _download_to_temp(client: PayloadMediaClient, asset: MediaAsset, directory: Path) -> Path:
-    target = directory / asset.filename
+    target = directory / asset.local_filename
     client.download_media(asset, target)
     return target
 
 
-def _ensure_temp_dir() -> Path:
-    settings.temp_dir.mkdir(parents=True, exist_ok=True)
-    return Path(tempfile.mkdtemp(prefix="video-job-", dir=settings.temp_dir))
+def _download_progress(
+    job_updates: _ProgressBatcher, start: int, end: int, total: int, label: str
+) -> Callable[[MediaAsset, Path], None]:
+    """Return a callback reporting download progress between ``start`` and ``end`` percent."""
+
+    completed = 0
+
+    def report(_asset: MediaAsset, _path: Path) -> None:
+        nonlocal completed
+        completed += 1
+        percent = start + (end - start) * completed // max(total, 1)
+        job_updates.update(
+            progress=_progress(percent, "download", f"Downloaded {completed} of {total} {label}s")
+        )
+
+    return report
+
+
+def _download_many(
+    client: PayloadMediaClient,
+    media_ids: list[str],
+    directory: Path,
+    *,
+    report: Callable[[MediaAsset, Path], None],
+    on_downloaded: Optional[Callable[[MediaAsset, Path], None]] = None,
+) -> list[tuple[MediaAsset, Path]]:
+    """Download ``media_ids`` concurrently, reporting progress as each file lands.
+
+    The download callback runs on the client's event loop, so progress reports
+    (a blocking job store write) are handed off to a reporting thread.
+    ``on_downloaded`` runs on the loop as well and must not block either.
+    """
+
+    with ThreadPoolExecutor(max_workers=1) as report_pool:
+
+        def downloaded(asset: MediaAsset, path: Path) -> None:
+            report_pool.submit(report, asset, path)
+            if on_downloaded is not None:
+                on_downloaded(asset, path)
+
+        return client.fetch_and_download_many(media_ids, directory, on_downloaded=downloaded)
+
+
+def _download_and_probe(
+    client: PayloadMediaClient,
+    media_ids: list[str],
+    directory: Path,
+    *,
+    ffprobe_binary: str,
+    report: Callable[[MediaAsset, Path], None],
+) -> tuple[list[tuple[MediaAsset, Path]], list[dict[str, Any]]]:
+    """Download ``media_ids`` concurrently, probing each file on a worker thread as soon as it lands."""
+
+    probes: dict[str, Future[dict[str, Any]]] = {}
+    probe_workers = min(MAX_PARALLEL_DOWNLOADS, len(set(media_ids))) or 1
+    with ThreadPoolExecutor(max_workers=probe_workers) as probe_pool:
+
+        def queue_probe(asset: MediaAsset, path: Path) -> None:
+            probes[asset.media_id] = probe_pool.submit(_probe_media, ffprobe_binary, asset, path)
+
+        downloads = _download_many(
+            client, media_ids, directory, report=report, on_downloaded=queue_probe
+        )
+        return downloads, [probes[asset.media_id].result() for asset, _ in downloads]
+
+
+def _worker_temp_root() -> Path:
+    """Return this worker process's scratch root, creating it on first use."""
+
+    global _cached_temp_root
+    pid = os.getpid()
+    if _cached_temp_root is None or _cached_temp_root[0] != pid:
+        root = settings.temp_dir / f"worker-{pid}"
+        root.mkdir(parents=True, exist_ok=True)
+        _cached_temp_root = (pid, root)
+    return _cached_temp_root[1]
+
+
+@worker_process_init.connect
+def _init_worker_temp_root(**_: Any) -> None:
+    _worker_temp_root()
+
+
+@worker_process_shutdown.connect
+def _remove_worker_temp_root(**_: Any) -> None:
+    global _cached_temp_root
+    if _cached_temp_root is not None and _cached_temp_root[0] == os.getpid():
+        _cleanup_temp_dir(_cached_temp_root[1])
+    _cached_temp_root = None
+
+
+def _ensure_temp_dir(job_id: str) -> Path:
+    temp_dir = _worker_temp_root() / job_id
+    temp_dir.mkdir(exist_ok=True)
+    return temp_dir
 
 
 @celery_app.task(name="video.concat", bind=True)
@@ -92,80 +301,99 @@ def concat_video(self: Task, job_id: str, payload: dict[str, Any]) -> None:
 
     from .job_models import ConcatJobRequest  # local import to avoid cycle
 
-    job_store = _get_job_store()
-    job_store.update_job(job_id, status=JobStatus.RUNNING, progress=_progress(5, "accepted", "Job accepted by worker"))
+    job_updates = _ProgressBatcher(_get_job_store(), job_id)
+    job_updates.update(status=JobStatus.RUNNING, progress=_progress(5, "accepted", "Job accepted by worker"))
 
     request = ConcatJobRequest.model_validate(payload)
 
     client = _get_payload_client()
-    temp_dir = _ensure_temp_dir()
+    ffmpeg_threads = _ffmpeg_threads()
+    video_encoder = _video_encoder()
+    ffmpeg_binary = settings.ffmpeg_binary
+    ffprobe_binary = settings.ffprobe_binary
+    crf = settings.default_crf
+    preset = settings.h264_preset
+    temp_dir = _ensure_temp_dir(job_id)
     segments_dir = temp_dir / "segments"
     segments_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        downloaded_paths: list[Path] = []
-        for index, input_item in enumerate(request.inputs):
-            job_store.update_job(job_id, progress=_progress(10 + index * 10, "download", f"Downloading input {index + 1}"))
-            asset = client.fetch_media(input_item.media_id)
-            downloaded = _download_to_temp(client, asset, segments_dir)
-
-            if input_item.start_ms is not None or input_item.end_ms is not None:
-                trimmed = segments_dir / f"segment_{index:03d}.mp4"
-                command: list[str] = [settings.ffmpeg_binary, "-y", "-i", str(downloaded)]
-                if input_item.start_ms is not None:
-                    command.extend(["-ss", f"{input_item.start_ms / 1000:.3f}"])
-                if input_item.end_ms is not None:
-                    if input_item.start_ms is not None:
-                        duration = (input_item.end_ms - input_item.start_ms) / 1000
-                        command.extend(["-t", f"{duration:.3f}"])
-                    else:
-                        command.extend(["-to", f"{input_item.end_ms / 1000:.3f}"])
-                command.extend(
-                    [
-                        "-c:v",
-                        "libx264",
-                        "-preset",
-                        "medium",
-                        "-crf",
-                        str(settings.default_crf),
-                        "-c:a",
-                        "aac",
-                        "-b:a",
-                        "192k",
-                        str(trimmed),
-                    ]
-                )
-                execute_ffmpeg(command)
-                downloaded_paths.append(trimmed)
-            else:
-                downloaded_paths.append(downloaded)
-
-        job_store.update_job(job_id, progress=_progress(60, "processing", "Concatenating segments"))
+        job_updates.update(progress=_progress(10, "download", "Downloading inputs"))
+        input_media_ids = [input_item.media_id for input_item in request.inputs]
+        downloads, input_probes = _download_and_probe(
+            client,
+            input_media_ids,
+            segments_dir,
+            ffprobe_binary=ffprobe_binary,
+            report=_download_progress(job_updates, 10, 50, len(set(input_media_ids)), "input"),
+        )
+        downloaded_paths = [path for _, path in downloads]
 
-        filelist_path = temp_dir / "inputs.txt"
-        generate_concat_filelist(downloaded_paths, filelist_path)
+        job_updates.update(progress=_progress(60, "processing", "Concatenating segments"))
 
+        needs_scale = not all(_at_target_geometry(probe) for probe in input_probes)
         output_basename = temp_dir / f"concat-{uuid4().hex}"
-        command = build_concat_command(
-            settings.ffmpeg_binary,
-            filelist_path,
-            output_basename,
-            output_format=request.output_format,
-            crf=settings.default_crf,
-            audio_passthrough=bool(request.audio_track is None),
-        )
+
+        if any(item.start_ms is not None or item.end_ms is not None for item in request.inputs):
+            # Trim and join in one filter graph so the job pays for a single encode.
+            segments = []
+            for item, path, probe in zip(
+                request.inputs, downloaded_paths, input_probes, strict=True
+            ):
+                summary = summarize_media(probe)
+                segments.append(
+                    ConcatSegment(
+                        path,
+                        start_ms=item.start_ms,
+                        end_ms=item.end_ms,
+                        has_audio="audioCodec" in summary,
+                        duration_ms=summary.get("durationMs"),
+                    )
+                )
+            command = build_trim_concat_command(
+                ffmpeg_binary,
+                segments,
+                output_basename,
+                output_format=request.output_format,
+                crf=crf,
+                ffmpeg_threads=ffmpeg_threads,
+                preset=preset,
+                video_encoder=video_encoder,
+                needs_scale=needs_scale,
+            )
+        else:
+            stream_copy = not needs_scale and _can_stream_copy(input_probes)
+
+            filelist_path = temp_dir / "inputs.txt"
+            generate_concat_filelist(downloaded_paths, filelist_path)
+
+            command = build_concat_command(
+                ffmpeg_binary,
+                filelist_path,
+                output_basename,
+                output_format=request.output_format,
+                crf=crf,
+                audio_passthrough=bool(request.audio_track is None),
+                ffmpeg_threads=ffmpeg_threads,
+                preset=preset,
+                video_encoder=video_encoder,
+                needs_scale=needs_scale,
+                stream_copy=stream_copy,
+            )
 
         execute_ffmpeg(command)
         final_output_path = output_basename.with_suffix(f".{request.output_format}")
 
         if request.audio_track:
-            job_store.update_job(job_id, progress=_progress(75, "audio", "Mixing override audio track"))
+            job_updates.update(progress=_progress(75, "audio", "Mixing override audio track"))
             audio_asset = client.fetch_media(request.audio_track)
             audio_path = _download_to_temp(client, audio_asset, temp_dir)
             mixed_path = temp_dir / f"mixed-{uuid4().hex}.{request.output_format}"
             mix_command = [
-                settings.ffmpeg_binary,
+                ffmpeg_binary,
                 "-y",
+                "-threads",
+                str(ffmpeg_threads),
                 "-i",
                 str(final_output_path),
                 "-i",
@@ -185,34 +413,32 @@ def concat_video(self: Task, job_id: str, payload: dict[str, Any]) -> None:
             execute_ffmpeg(mix_command)
             final_output_path = mixed_path
 
-        job_store.update_job(job_id, progress=_progress(85, "probe", "Analyzing output"))
-        metadata = probe_streams(settings.ffprobe_binary, final_output_path)
-        summary = summarize_media(metadata)
+        job_updates.update(progress=_progress(85, "probe", "Analyzing output"))
+        metadata = probe_streams(ffprobe_binary, final_output_path)
+        summary = _safe_metadata(summarize_media(metadata))
 
-        job_store.update_job(job_id, progress=_progress(92, "upload", "Uploading result to PayloadCMS"))
+        job_updates.update(progress=_progress(92, "upload", "Uploading result to PayloadCMS"))
         upload_metadata = {
             "jobId": job_id,
             "operation": "concat",
-            "inputs": json.dumps([item.media_id for item in request.inputs]),
+            "inputs": orjson.dumps([item.media_id for item in request.inputs]).decode(),
             **request.metadata,
             **summary,
         }
         upload_response = client.upload_media(final_output_path, upload_metadata)
         result_media_id = str(upload_response.get("id") or upload_response.get("_id"))
 
-        job_store.update_job(
-            job_id,
+        job_updates.update(
             status=JobStatus.SUCCEEDED,
             progress=_progress(100, "completed", "Job completed"),
             result_media_id=result_media_id,
-            metadata=_safe_metadata(summary),
+            metadata=summary,
             message="Video concatenation successful",
         )
 
     except FFmpegExecutionError as exc:
         logger.error("FFmpeg execution failed", job_id=job_id, error=exc.stderr)
-        job_store.update_job(
-            job_id,
+        job_updates.update(
             status=JobStatus.FAILED,
             progress=_progress(100, "failed", "Processing failed"),
             error=str(exc),
@@ -221,8 +447,7 @@ def concat_video(self: Task, job_id: str, payload: dict[str, Any]) -> None:
         raise
     except Exception as exc:  # pragma: no cover - defensive logging
         logger.exception("Concat job failed", job_id=job_id)
-        job_store.update_job(
-            job_id,
+        job_updates.update(
             status=JobStatus.FAILED,
             progress=_progress(100, "failed", "Processing failed"),
             error=str(exc),
@@ -230,6 +455,7 @@ def concat_video(self: Task, job_id: str, payload: dict[str, Any]) -> None:
         )
         raise
     finally:
+        job_updates.flush()
         _cleanup_temp_dir(temp_dir)
 
 
@@ -239,24 +465,30 @@ def overlay_video(self: Task, job_id: str, payload: dict[str, Any]) -> None:
 
     from .job_models import OverlayJobRequest
 
-    job_store = _get_job_store()
-    job_store.update_job(job_id, status=JobStatus.RUNNING, progress=_progress(5, "accepted", "Job accepted by worker"))
+    job_updates = _ProgressBatcher(_get_job_store(), job_id)
+    job_updates.update(status=JobStatus.RUNNING, progress=_progress(5, "accepted", "Job accepted by worker"))
 
     request = OverlayJobRequest.model_validate(payload)
     client = _get_payload_client()
-    temp_dir = _ensure_temp_dir()
+    ffmpeg_threads = _ffmpeg_threads()
+    video_encoder = _video_encoder()
+    ffmpeg_binary = settings.ffmpeg_binary
+    ffprobe_binary = settings.ffprobe_binary
+    crf = settings.default_crf
+    preset = settings.h264_preset
+    temp_dir = _ensure_temp_dir(job_id)
 
     try:
-        base_asset = client.fetch_media(request.input_media_id)
-        base_path = _download_to_temp(client, base_asset, temp_dir)
-
-        overlay_assets: list[MediaAsset] = []
-        overlay_paths: list[Path] = []
-        for index, overlay in enumerate(request.overlays):
-            job_store.update_job(job_id, progress=_progress(15 + index * 5, "download", f"Downloading overlay {index + 1}"))
-            asset = client.fetch_media(overlay.media_id)
-            overlay_assets.append(asset)
-            overlay_paths.append(_download_to_temp(client, asset, temp_dir))
+        job_updates.update(progress=_progress(10, "download", "Downloading base video and overlays"))
+        media_ids = [request.input_media_id, *(overlay.media_id for overlay in request.overlays)]
+        downloads = _download_many(
+            client,
+            media_ids,
+            temp_dir,
+            report=_download_progress(job_updates, 10, 50, len(set(media_ids)), "asset"),
+        )
+        (base_asset, base_path), overlay_downloads = downloads[0], downloads[1:]
+        overlay_paths = [path for _, path in overlay_downloads]
 
         filter_specs = [
             {
@@ -270,50 +502,54 @@ def overlay_video(self: Task, job_id: str, payload: dict[str, Any]) -> None:
             }
             for idx, overlay in enumerate(request.overlays)
         ]
-        filter_graph = build_overlay_filter(filter_specs)
+        needs_scale = not _at_target_geometry(_probe_media(ffprobe_binary, base_asset, base_path))
+        filter_graph = build_overlay_filter(filter_specs, needs_scale=needs_scale)
 
-        job_store.update_job(job_id, progress=_progress(60, "processing", "Rendering overlays"))
+        job_updates.update(progress=_progress(60, "processing", "Rendering overlays"))
 
         output_path = temp_dir / f"overlay-{uuid4().hex}.{request.output_format}"
         command = build_overlay_command(
-            settings.ffmpeg_binary,
+            ffmpeg_binary,
             base_path,
             overlay_paths,
             Path(output_path),
             output_format=request.output_format,
             filter_graph=filter_graph,
+            ffmpeg_threads=ffmpeg_threads,
+            crf=crf,
+            preset=preset,
+            video_encoder=video_encoder,
+            needs_scale=needs_scale,
         )
         execute_ffmpeg(command)
 
-        job_store.update_job(job_id, progress=_progress(85, "probe", "Analyzing output"))
-        metadata = probe_streams(settings.ffprobe_binary, output_path)
-        summary = summarize_media(metadata)
+        job_updates.update(progress=_progress(85, "probe", "Analyzing output"))
+        metadata = probe_streams(ffprobe_binary, output_path)
+        summary = _safe_metadata(summarize_media(metadata))
 
-        job_store.update_job(job_id, progress=_progress(92, "upload", "Uploading result to PayloadCMS"))
+        job_updates.update(progress=_progress(92, "upload", "Uploading result to PayloadCMS"))
         upload_metadata = {
             "jobId": job_id,
             "operation": "overlay",
-            "inputs": json.dumps([request.input_media_id]),
-            "overlays": json.dumps([overlay.media_id for overlay in request.overlays]),
+            "inputs": orjson.dumps([request.input_media_id]).decode(),
+            "overlays": orjson.dumps([overlay.media_id for overlay in request.overlays]).decode(),
             **request.metadata,
             **summary,
         }
         upload_response = client.upload_media(output_path, upload_metadata)
         result_media_id = str(upload_response.get("id") or upload_response.get("_id"))
 
-        job_store.update_job(
-            job_id,
+        job_updates.update(
             status=JobStatus.SUCCEEDED,
             progress=_progress(100, "completed", "Job completed"),
             result_media_id=result_media_id,
-            metadata=_safe_metadata(summary),
+            metadata=summary,
             message="Overlay applied successfully",
         )
 
     except FFmpegExecutionError as exc:
         logger.error("FFmpeg execution failed", job_id=job_id, error=exc.stderr)
-        job_store.update_job(
-            job_id,
+        job_updates.update(
             status=JobStatus.FAILED,
             progress=_progress(100, "failed", "Processing failed"),
             error=str(exc),
@@ -322,8 +558,7 @@ def overlay_video(self: Task, job_id: str, payload: dict[str, Any]) -> None:
         raise
     except Exception as exc:  # pragma: no cover - defensive logging
         logger.exception("Overlay job failed", job_id=job_id)
-        job_store.update_job(
-            job_id,
+        job_updates.update(
             status=JobStatus.FAILED,
             progress=_progress(100, "failed", "Processing failed"),
             error=str(exc),
@@ -331,24 +566,43 @@ def overlay_video(self: Task, job_id: str, payload: dict[str, Any]) -> None:
         )
         raise
     finally:
+        job_updates.flush()
         _cleanup_temp_dir(temp_dir)
 
 
+@task_postrun.connect
+def _release_job_slot(sender: Optional[Task] = None, **_: Any) -> None:
+    """Free the admission slot taken when the job was accepted by the API.
+
+    Releasing is unconditional: the API may enforce a limit the worker is not
+    configured with, and releasing with no slot held is a no-op.
+    """
+
+    if sender is not None and sender.name in {"video.concat", "video.overlay"}:
+        _get_job_store().release_job_slot()
+
+
 def enqueue_concat_job(job_id: str, payload: dict[str, Any]) -> None:
-    concat_video.apply_async(args=(job_id, payload))
+    concat_video.apply_async(args=(job_id, payload), ignore_result=True)
 
 
 def enqueue_overlay_job(job_id: str, payload: dict[str, Any]) -> None:
-    overlay_video.apply_async(args=(job_id, payload))
+    overlay_video.apply_async(args=(job_id, payload), ignore_result=True)
+
+
+def enqueue_jobs(jobs: list[tuple[str, str, dict[str, Any]]]) -> None:
+    """Publish several ``(job_type, job_id, payload)`` jobs through one broker producer."""
+
+    tasks_by_type = {"concat": concat_video, "overlay": overlay_video}
+    with celery_app.producer_or_acquire() as producer:
+        for job_type, job_id, payload in jobs:
+            tasks_by_type[job_type].apply_async(
+                args=(job_id, payload), producer=producer, ignore_result=True
+            )
 
 
 def _cleanup_temp_dir(temp_dir: Path) -> None:
     try:
-        for nested in sorted(temp_dir.rglob("*"), reverse=True):
-            if nested.is_file():
-                nested.unlink(missing_ok=True)
-            elif nested.is_dir():
-                nested.rmdir()
-        temp_dir.rmdir()
+        shutil.rmtree(temp_dir)
     except Exception:  # pragma: no cover - best effort cleanup
         logger.debug("Temporary directory cleanup failed", path=temp_dir)
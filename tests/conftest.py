@@ -30,10 +30,13 @@ def enqueue_spy(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str, dict]]:
     def record_overlay(job_id: str, payload: dict) -> None:
         captured.append(("overlay", job_id, payload))
 
+    def record_batch(jobs: list[tuple[str, str, dict]]) -> None:
+        captured.extend(jobs)
+
     monkeypatch.setattr("mcp_video_processing_service.tasks.enqueue_concat_job", record_concat)
     monkeypatch.setattr("mcp_video_processing_service.tasks.enqueue_overlay_job", record_overlay)
-    monkeypatch.setattr("mcp_video_processing_service.api.routes.enqueue_concat_job", record_concat)
-    monkeypatch.setattr("mcp_video_processing_service.api.routes.enqueue_overlay_job", record_overlay)
+    monkeypatch.setattr("mcp_video_processing_service.tasks.enqueue_jobs", record_batch)
+    monkeypatch.setattr("mcp_video_processing_service.api.routes.enqueue_jobs", record_batch)
     return captured
 
 
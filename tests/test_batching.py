@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from mcp_video_processing_service.batching import DynBatcher
+
+
+def test_concurrent_submissions_share_a_batch() -> None:
+    batches: list[list[int]] = []
+
+    async def process(batch: list[int]) -> None:
+        batches.append(batch)
+
+    async def scenario() -> None:
+        batcher: DynBatcher[int] = DynBatcher(process, max_batch_size=3, max_delay=0.05)
+        batcher.start()
+        await asyncio.gather(*(batcher.submit(item) for item in range(5)))
+        await batcher.stop()
+
+    asyncio.run(scenario())
+
+    assert batches == [[0, 1, 2], [3, 4]]
+
+
+def test_batch_errors_reach_every_submitter() -> None:
+    async def process(batch: list[int]) -> None:
+        raise ValueError("redis unavailable")
+
+    async def scenario() -> list[object]:
+        batcher: DynBatcher[int] = DynBatcher(process, max_delay=0.01)
+        batcher.start()
+        results = await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+        await batcher.stop()
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_submit_requires_started_batcher() -> None:
+    async def process(batch: list[int]) -> None:
+        return None
+
+    batcher: DynBatcher[int] = DynBatcher(process)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(batcher.submit(1))
@@ -2,10 +2,15 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from mcp_video_processing_service.ffmpeg.command_builder import (
+    ConcatSegment,
     build_concat_command,
     build_overlay_command,
     build_overlay_filter,
+    build_trim_concat_command,
+    build_video_encoder_args,
     generate_concat_filelist,
 )
 
@@ -40,9 +45,38 @@ def test_build_concat_command(tmp_path: Path) -> None:
 
     assert command[:4] == ["ffmpeg", "-y", "-f", "concat"]
     assert "-safe" in command
+    assert "-threads" not in command
     assert command[-1].endswith(".mp4")
 
 
+def test_build_concat_command_with_threads(tmp_path: Path) -> None:
+    command = build_concat_command(
+        "ffmpeg",
+        tmp_path / "inputs.txt",
+        tmp_path / "output",
+        ffmpeg_threads=2,
+    )
+
+    thread_positions = [idx for idx, arg in enumerate(command) if arg == "-threads"]
+    assert len(thread_positions) == 2
+    assert thread_positions[0] < command.index("-i") < thread_positions[1]
+    assert command[thread_positions[1] + 1] == "2"
+
+
+def test_build_concat_command_defaults_to_veryfast(tmp_path: Path) -> None:
+    command = build_concat_command("ffmpeg", tmp_path / "inputs.txt", tmp_path / "output")
+
+    assert command[command.index("-c:v") + 1] == "libx264"
+    assert command[command.index("-preset") + 1] == "veryfast"
+    assert "-hwaccel" not in command
+
+
+def test_build_video_encoder_args_for_nvenc() -> None:
+    args = build_video_encoder_args(video_encoder="h264_nvenc", crf=23, preset="veryfast")
+
+    assert args == ["-c:v", "h264_nvenc", "-cq", "23", "-preset", "p4"]
+
+
 def test_build_overlay_command(tmp_path: Path) -> None:
     base = tmp_path / "base.mp4"
     base.touch()
@@ -66,3 +100,98 @@ def test_build_overlay_command(tmp_path: Path) -> None:
     assert command[0] == "ffmpeg"
     assert "-filter_complex" in command
     assert command[-1].endswith(".mp4")
+
+
+def test_build_overlay_filter_reuses_template_for_same_shape() -> None:
+    first = build_overlay_filter(
+        [{"index": 1, "x": 10, "y": 20, "start": 0, "end": 1000, "opacity": 0.5, "scale": 0.5}]
+    )
+    second = build_overlay_filter(
+        [{"index": 1, "x": 30, "y": 40, "start": 1500, "end": 2500, "opacity": 0.25, "scale": 2}]
+    )
+
+    assert first == (
+        "[0:v]scale=1280:720:force_original_aspect_ratio=decrease,pad=1280:720:(ow-iw)/2:(oh-ih)/2,setsar=1[base];"
+        "[1:v]scale=iw*0.5:ih*0.5,format=rgba,colorchannelmixer=aa=0.5[overlay1];"
+        "[base][overlay1]overlay=x=10:y=20:enable='gte(t,0.000)*lte(t,1.000)'[ov1];"
+        "[ov1]setsar=1[outv]"
+    )
+    assert "overlay=x=30:y=40:enable='gte(t,1.500)*lte(t,2.500)'" in second
+    assert "scale=iw*2:ih*2,format=rgba,colorchannelmixer=aa=0.25" in second
+
+
+def test_build_overlay_filter_skips_scale_when_base_matches_target() -> None:
+    graph = build_overlay_filter(
+        [{"index": 1, "x": 0, "y": 0, "start": None, "end": None, "opacity": 1.0, "scale": None}],
+        needs_scale=False,
+    )
+
+    assert graph.startswith("[0:v]setsar=1[base];")
+    assert "scale=1280:720" not in graph
+
+
+def test_build_concat_command_without_scaling(tmp_path: Path) -> None:
+    command = build_concat_command(
+        "ffmpeg", tmp_path / "inputs.txt", tmp_path / "output", needs_scale=False
+    )
+
+    assert "-vf" not in command
+    assert command[command.index("-c:v") + 1] == "libx264"
+
+
+def test_build_concat_command_stream_copy(tmp_path: Path) -> None:
+    command = build_concat_command(
+        "ffmpeg",
+        tmp_path / "inputs.txt",
+        tmp_path / "output",
+        stream_copy=True,
+        ffmpeg_threads=4,
+    )
+
+    assert command[command.index("-c") + 1] == "copy"
+    assert "-c:v" not in command
+    assert "-vf" not in command
+    assert command[-1].endswith(".mp4")
+
+
+def test_build_trim_concat_command_uses_single_filter_graph(tmp_path: Path) -> None:
+    inputs = [
+        ConcatSegment(tmp_path / "a.mp4", 1500, 4000),
+        ConcatSegment(tmp_path / "b.mp4"),
+        ConcatSegment(tmp_path / "c.mp4", None, 2000),
+    ]
+
+    command = build_trim_concat_command("ffmpeg", inputs, tmp_path / "output", ffmpeg_threads=2)
+
+    assert command.count("-i") == 3
+    for position in (idx for idx, arg in enumerate(command) if arg == "-i"):
+        assert command[position - 2 : position] == ["-threads", "2"]
+    graph = command[command.index("-filter_complex") + 1]
+    assert "[0:v]trim=start=1500ms:end=4000ms,setpts=PTS-STARTPTS" in graph
+    assert "[0:a]atrim=start=1500ms:end=4000ms,asetpts=PTS-STARTPTS" in graph
+    assert "[1:v]setpts=PTS-STARTPTS,scale=1280:720" in graph
+    assert "[2:v]trim=end=2000ms," in graph
+    assert graph.endswith("[v0][a0][v1][a1][v2][a2]concat=n=3:v=1:a=1[outv][outa]")
+    assert command[command.index("-c:v") + 1] == "libx264"
+    assert command[-1].endswith("output.mp4")
+
+
+def test_build_trim_concat_command_fills_silent_inputs(tmp_path: Path) -> None:
+    inputs = [
+        ConcatSegment(tmp_path / "a.mp4", 1500, None, has_audio=False, duration_ms=6000),
+        ConcatSegment(tmp_path / "b.mp4"),
+    ]
+
+    command = build_trim_concat_command("ffmpeg", inputs, tmp_path / "output")
+
+    graph = command[command.index("-filter_complex") + 1]
+    assert "[0:a]" not in graph
+    assert "anullsrc=channel_layout=stereo:sample_rate=48000,atrim=duration=4500ms," in graph
+    assert "[1:a]asetpts=PTS-STARTPTS" in graph
+
+
+def test_build_trim_concat_command_requires_length_for_silent_inputs(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        build_trim_concat_command(
+            "ffmpeg", [ConcatSegment(tmp_path / "a.mp4", has_audio=False)], tmp_path / "output"
+        )
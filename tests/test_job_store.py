@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")  # fakeredis needs it to run the Lua scripts
+
+from fakeredis import aioredis as fake_aioredis  # noqa: E402
+
+from mcp_video_processing_service import job_store  # noqa: E402
+from mcp_video_processing_service.job_models import (  # noqa: E402
+    JobRecord,
+    JobStatus,
+    ProgressSnapshot,
+)
+from mcp_video_processing_service.job_store import (  # noqa: E402
+    RedisJobStore,
+    RedisJobStoreSync,
+)
+
+
+@pytest.fixture()
+def fake_redis_server(monkeypatch: pytest.MonkeyPatch) -> "fakeredis.FakeServer":
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        job_store,
+        "get_sync_redis",
+        lambda redis_url, max_connections=None: fakeredis.FakeRedis(server=server),
+    )
+    monkeypatch.setattr(
+        job_store.AsyncRedis,
+        "from_url",
+        lambda redis_url, **_: fake_aioredis.FakeRedis(server=server),
+    )
+    return server
+
+
+def _record(job_id: str = "job-1") -> JobRecord:
+    return JobRecord(
+        job_id=job_id,
+        job_type="concat",
+        params={"inputs": [{"media_id": "m1"}], "tags": []},
+        metadata={"project": "demo", "big": 12345678901234567, "empty": []},
+    )
+
+
+def test_sync_store_round_trips_updates(fake_redis_server: "fakeredis.FakeServer") -> None:
+    store = RedisJobStoreSync("redis://test")
+    store.create_job(_record())
+
+    updated = store.update_job(
+        "job-1",
+        status=JobStatus.RUNNING,
+        progress=ProgressSnapshot(percent=40, current_step="download"),
+        metadata={"durationMs": 1500},
+    )
+
+    assert updated is not None
+    assert updated.status == JobStatus.RUNNING
+    assert updated.progress is not None and updated.progress.percent == 40
+    assert updated.params == {"inputs": [{"media_id": "m1"}], "tags": []}
+    assert updated.metadata == {
+        "project": "demo",
+        "big": 12345678901234567,
+        "empty": [],
+        "durationMs": 1500,
+    }
+    assert store.get_job("job-1") == updated
+    assert store.get_job("missing") is None
+    assert store.update_job("missing", status=JobStatus.FAILED) is None
+
+
+def test_async_store_round_trips_jobs(fake_redis_server: "fakeredis.FakeServer") -> None:
+    async def scenario() -> None:
+        store = RedisJobStore("redis://test")
+        await store.create_jobs([_record("job-1"), _record("job-2")])
+
+        updated = await store.update_job(
+            "job-2",
+            status=JobStatus.SUCCEEDED,
+            result_media_id="out-1",
+            metadata={"project": "renamed"},
+        )
+        assert updated is not None
+        assert updated.result_media_id == "out-1"
+        assert updated.metadata["project"] == "renamed"
+        assert updated.metadata["big"] == 12345678901234567
+
+        first, second, missing = await store.get_jobs(["job-1", "job-2", "missing"])
+        assert first is not None and first.status == JobStatus.QUEUED
+        assert second == updated
+        assert missing is None
+        assert await store.get_job("missing") is None
+        await store.close()
+
+    asyncio.run(scenario())
+
+
+def test_job_slots_are_bounded_and_released(fake_redis_server: "fakeredis.FakeServer") -> None:
+    async def scenario() -> None:
+        store = RedisJobStore("redis://test")
+        assert [await store.acquire_job_slot(2) for _ in range(3)] == [True, True, False]
+
+        RedisJobStoreSync("redis://test").release_job_slot()
+        assert await store.acquire_job_slot(2) is True
+
+        for _ in range(4):
+            await store.release_job_slot()
+        assert [await store.acquire_job_slot(1) for _ in range(2)] == [True, False]
+        await store.close()
+
+    asyncio.run(scenario())
+
+
+def test_job_slots_leaked_by_workers_expire(fake_redis_server: "fakeredis.FakeServer") -> None:
+    async def scenario() -> None:
+        store = RedisJobStore("redis://test", slot_ttl=0.05)
+        assert [await store.acquire_job_slot(1) for _ in range(2)] == [True, False]
+
+        await asyncio.sleep(0.1)
+        assert await store.acquire_job_slot(1) is True
+        await store.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from mcp_video_processing_service.payload_client import (
+    MAX_PARALLEL_DOWNLOADS,
+    AsyncPayloadMediaClient,
+    MediaAsset,
+    PayloadMediaClient,
+)
+
+
+def _media_response(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={"url": "https://cdn.test/clip.mp4", "filename": "clip.mp4", "mimeType": "video/mp4"},
+        headers={"ETag": '"v1"'},
+    )
+
+
+def test_fetch_media_reuses_cached_metadata() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return _media_response(request)
+
+    with PayloadMediaClient(
+        "https://cms.test/api",
+        api_token="secret",
+        cache_ttl=30,
+        transport=httpx.MockTransport(handler),
+    ) as client:
+        first = client.fetch_media("abc")
+        second = client.fetch_media("abc")
+
+    assert first == second
+    assert first.download_url == "https://cdn.test/clip.mp4"
+    assert first.etag == '"v1"'
+    assert len(requests) == 1
+    assert str(requests[0].url) == "https://cms.test/api/media/abc"
+    assert requests[0].headers["Authorization"] == "Bearer secret"
+
+
+def test_download_media_writes_stream_to_destination(tmp_path: Path) -> None:
+    payload = b"frame" * 300_000
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "cdn.test":
+            return httpx.Response(200, content=payload)
+        return _media_response(request)
+
+    destination = tmp_path / "nested" / "clip.mp4"
+    with PayloadMediaClient("https://cms.test/api", transport=httpx.MockTransport(handler)) as client:
+        client.download_media(client.fetch_media("abc"), destination)
+
+    assert destination.read_bytes() == payload
+
+
+def test_upload_media_streams_file_with_metadata(tmp_path: Path) -> None:
+    source = tmp_path / "render.mp4"
+    source.write_bytes(b"\x00\x01" * 50_000)
+    received: dict[str, object] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        received["url"] = str(request.url)
+        received["body"] = request.read()
+        received["content_type"] = request.headers["Content-Type"]
+        return httpx.Response(201, json={"doc": {"id": "out-1"}})
+
+    with PayloadMediaClient("https://cms.test/api", transport=httpx.MockTransport(handler)) as client:
+        response = client.upload_media(source, {"alt": "render", "mimeType": "video/mp4"})
+
+    assert response == {"doc": {"id": "out-1"}}
+    assert received["url"] == "https://cms.test/api/media"
+    assert str(received["content_type"]).startswith("multipart/form-data")
+    body = received["body"]
+    assert isinstance(body, bytes)
+    assert source.read_bytes() in body
+    assert b'name="alt"' in body
+    assert b"Content-Type: video/mp4" in body
+
+
+def test_async_client_downloads_each_asset_once(tmp_path: Path) -> None:
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        if request.url.host == "cdn.test":
+            return httpx.Response(200, content=request.url.path.encode())
+        media_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(
+            200, json={"url": f"https://cdn.test/{media_id}.mp4", "filename": "clip.mp4"}
+        )
+
+    async def run() -> list[tuple[str, Path]]:
+        async with AsyncPayloadMediaClient(
+            "https://cms.test/api", transport=httpx.MockTransport(handler)
+        ) as client:
+            downloads = await client.fetch_and_download_many(["a", "b", "a"], tmp_path)
+        return [(asset.media_id, path) for asset, path in downloads]
+
+    downloads = asyncio.run(run())
+
+    assert [media_id for media_id, _ in downloads] == ["a", "b", "a"]
+    assert downloads[0][1] == tmp_path / "a.mp4"
+    assert downloads[1][1].read_bytes() == b"/b.mp4"
+    assert len(requested) == 4
+
+
+def test_async_client_caps_concurrent_downloads(tmp_path: Path) -> None:
+    active = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        if request.url.host != "cdn.test":
+            media_id = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(
+                200, json={"url": f"https://cdn.test/{media_id}.mp4", "filename": "clip.mp4"}
+            )
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return httpx.Response(200, content=b"data")
+
+    async def run() -> None:
+        async with AsyncPayloadMediaClient(
+            "https://cms.test/api", transport=httpx.MockTransport(handler)
+        ) as client:
+            media_ids = [f"m{idx}" for idx in range(MAX_PARALLEL_DOWNLOADS * 3)]
+            await client.fetch_and_download_many(media_ids, tmp_path)
+
+    asyncio.run(run())
+
+    assert peak == MAX_PARALLEL_DOWNLOADS
+
+
+def test_batch_download_shares_metadata_through_redis(tmp_path: Path) -> None:
+    fakeredis = pytest.importorskip("fakeredis")
+    shared = fakeredis.FakeRedis()
+    metadata_requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "cdn.test":
+            return httpx.Response(200, content=b"data")
+        metadata_requests.append(request.url.path)
+        return _media_response(request)
+
+    for worker in range(2):
+        with PayloadMediaClient(
+            "https://cms.test/api",
+            cache=shared,
+            cache_ttl=30,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            downloads = client.fetch_and_download_many(["abc"], tmp_path / str(worker))
+        assert downloads[0][1].read_bytes() == b"data"
+
+    assert metadata_requests == ["/api/media/abc"]
+    assert shared.ttl("media:abc") > 0
+
+
+@pytest.mark.parametrize("media_id", ["../../etc/passwd", "a/b", "..", "a\\b"])
+def test_local_filename_stays_inside_directory(tmp_path: Path, media_id: str) -> None:
+    asset = MediaAsset(media_id, "clip.mp4", "video/mp4", "https://cdn.test/clip.mp4")
+
+    destination = (tmp_path / asset.local_filename).resolve()
+
+    assert destination.parent == tmp_path.resolve()
+    assert destination.suffix == ".mp4"
+    assert MediaAsset("64f0c2", "clip.mp4", "", "").local_filename == "64f0c2.mp4"
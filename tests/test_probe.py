@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import orjson
+import pytest
+
+from mcp_video_processing_service.ffmpeg import probe
+from mcp_video_processing_service.ffmpeg.probe import (
+    matches_geometry,
+    probe_cached,
+    streams_compatible,
+)
+from mcp_video_processing_service.tasks import _can_stream_copy
+
+
+def _probe(**video_overrides: Any) -> dict[str, Any]:
+    video = {
+        "codec_type": "video",
+        "codec_name": "h264",
+        "profile": "High",
+        "width": 1280,
+        "height": 720,
+        "pix_fmt": "yuv420p",
+        "sample_aspect_ratio": "1:1",
+        "time_base": "1/15360",
+    }
+    video.update(video_overrides)
+    audio = {"codec_type": "audio", "codec_name": "aac", "sample_rate": "48000", "channels": 2}
+    return {"streams": [video, audio], "format": {"duration": "4.0"}}
+
+
+def test_matching_h264_inputs_are_stream_copied() -> None:
+    assert streams_compatible([_probe(), _probe()])
+    assert _can_stream_copy([_probe(), _probe()])
+
+
+def test_signature_mismatches_are_re_encoded() -> None:
+    assert not _can_stream_copy([_probe(), _probe(time_base="1/90000")])
+    assert not _can_stream_copy([_probe(), _probe(profile="Main")])
+
+
+def test_inputs_without_video_are_not_stream_copied() -> None:
+    audio_only = {"streams": [{"codec_type": "audio", "codec_name": "aac"}]}
+
+    assert not streams_compatible([audio_only, audio_only])
+    assert not _can_stream_copy([audio_only, audio_only])
+    assert not _can_stream_copy([])
+
+
+def test_non_h264_inputs_are_not_stream_copied() -> None:
+    hevc = _probe(codec_name="hevc", profile="Main")
+
+    assert streams_compatible([hevc, hevc])
+    assert not _can_stream_copy([hevc, hevc])
+
+
+def test_matches_geometry_treats_unset_sar_as_square() -> None:
+    assert matches_geometry(_probe(), 1280, 720)
+    assert matches_geometry(_probe(sample_aspect_ratio="0:1"), 1280, 720)
+    assert matches_geometry(_probe(sample_aspect_ratio=None), 1280, 720)
+
+
+def test_matches_geometry_rejects_non_square_pixels() -> None:
+    assert not matches_geometry(_probe(sample_aspect_ratio="4:3"), 1280, 720)
+
+
+def test_matches_geometry_rejects_other_sizes() -> None:
+    assert not matches_geometry(_probe(width=1920, height=1080), 1280, 720)
+    assert not matches_geometry(_probe(height=718), 1280, 720)
+
+
+def test_matches_geometry_requires_a_video_stream() -> None:
+    assert not matches_geometry({"streams": [{"codec_type": "audio"}]}, 1280, 720)
+    assert not matches_geometry({}, 1280, 720)
+
+
+@pytest.fixture()
+def ffprobe_calls(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    calls: list[Path] = []
+
+    def fake_probe_streams(_ffprobe_binary: str, media_path: Path) -> dict[str, Any]:
+        calls.append(media_path)
+        return _probe()
+
+    monkeypatch.setattr(probe, "probe_streams", fake_probe_streams)
+    return calls
+
+
+def test_probe_cached_stores_misses_with_ttl(tmp_path: Path, ffprobe_calls: list[Path]) -> None:
+    fakeredis = pytest.importorskip("fakeredis")
+    cache = fakeredis.FakeRedis()
+
+    metadata = probe_cached("ffprobe", tmp_path / "a.mp4", cache=cache, media_id="m1", etag='"v1"', ttl=120)
+
+    assert metadata == _probe()
+    assert ffprobe_calls == [tmp_path / "a.mp4"]
+    assert orjson.loads(cache.get('probe:m1:"v1"')) == metadata
+    assert 0 < cache.ttl('probe:m1:"v1"') <= 120
+
+
+def test_probe_cached_hits_skip_ffprobe(tmp_path: Path, ffprobe_calls: list[Path]) -> None:
+    fakeredis = pytest.importorskip("fakeredis")
+    cache = fakeredis.FakeRedis()
+    cache.set('probe:m1:"v1"', orjson.dumps({"streams": []}))
+
+    metadata = probe_cached("ffprobe", tmp_path / "a.mp4", cache=cache, media_id="m1", etag='"v1"')
+
+    assert metadata == {"streams": []}
+    assert ffprobe_calls == []
+
+
+def test_probe_cached_bypasses_redis_without_etag(tmp_path: Path, ffprobe_calls: list[Path]) -> None:
+    fakeredis = pytest.importorskip("fakeredis")
+    cache = fakeredis.FakeRedis()
+
+    for _ in range(2):
+        probe_cached("ffprobe", tmp_path / "a.mp4", cache=cache, media_id="m1", etag=None)
+
+    assert len(ffprobe_calls) == 2
+    assert cache.keys() == []
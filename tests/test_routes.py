@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+
+import pytest
 from fastapi.testclient import TestClient
 
+from mcp_video_processing_service.job_store import InMemoryJobStore
+from mcp_video_processing_service.main import create_app, settings
+
 
 def test_submit_concat_job(api_client: TestClient, enqueue_spy: list[tuple[str, str, dict]]) -> None:
     payload = {
@@ -51,3 +57,64 @@ def test_submit_overlay_job(api_client: TestClient, enqueue_spy: list[tuple[str,
 def test_get_job_not_found(api_client: TestClient) -> None:
     response = api_client.get("/jobs/missing")
     assert response.status_code == 404
+
+
+def test_batch_job_status(api_client: TestClient, enqueue_spy: list[tuple[str, str, dict]]) -> None:
+    response = api_client.post("/jobs/concat", json={"inputs": [{"media_id": "media-1"}]})
+    job_id = response.json()["jobId"]
+
+    batch_response = api_client.post("/jobs/batch", json={"job_ids": [job_id, "missing"]})
+    assert batch_response.status_code == 200
+    body = batch_response.json()
+    assert body[job_id]["jobId"] == job_id
+    assert body[job_id]["status"] == "queued"
+    assert body["missing"] is None
+
+
+def test_batch_job_status_rejects_oversized_batch(api_client: TestClient) -> None:
+    job_ids = [f"job-{idx}" for idx in range(101)]
+
+    response = api_client.post("/jobs/batch", json={"job_ids": job_ids})
+    assert response.status_code == 422
+
+
+def test_submissions_beyond_inflight_limit_are_rejected(
+    monkeypatch: pytest.MonkeyPatch,
+    in_memory_store: InMemoryJobStore,
+    enqueue_spy: list[tuple[str, str, dict]],
+) -> None:
+    monkeypatch.setattr(settings, "max_inflight_jobs", 1)
+    monkeypatch.setattr(settings, "admission_queue_timeout_seconds", 0.0)
+    payload = {"inputs": [{"media_id": "media-1"}]}
+
+    with TestClient(create_app(job_store=in_memory_store)) as client:
+        assert client.post("/jobs/concat", json=payload).status_code == 202
+        rejected = client.post("/jobs/concat", json=payload)
+        assert rejected.status_code == 503
+        assert client.post("/jobs/concat", json={"inputs": []}).status_code == 503
+
+        asyncio.run(in_memory_store.release_job_slot())
+        assert client.post("/jobs/concat", json={"inputs": []}).status_code == 422
+        assert client.post("/jobs/concat", json=payload).status_code == 202
+
+    assert len(enqueue_spy) == 2
+
+
+def test_admission_rejections_carry_cors_headers(
+    monkeypatch: pytest.MonkeyPatch,
+    in_memory_store: InMemoryJobStore,
+    enqueue_spy: list[tuple[str, str, dict]],
+) -> None:
+    monkeypatch.setattr(settings, "max_inflight_jobs", 1)
+    monkeypatch.setattr(settings, "admission_queue_timeout_seconds", 0.0)
+    payload = {"inputs": [{"media_id": "media-1"}]}
+    headers = {"Origin": "https://ui.test"}
+
+    with TestClient(create_app(job_store=in_memory_store)) as client:
+        accepted = client.post("/jobs/concat", json=payload, headers=headers)
+        rejected = client.post("/jobs/concat", json=payload, headers=headers)
+
+    assert accepted.status_code == 202
+    assert rejected.status_code == 503
+    assert rejected.headers["retry-after"] == "5"
+    assert "access-control-allow-origin" in rejected.headers
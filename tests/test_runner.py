@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+
+import pytest
+
+from mcp_video_processing_service.ffmpeg.runner import (
+    FFmpegExecutionError,
+    execute_ffmpeg_async,
+)
+
+
+def test_execute_ffmpeg_async_returns_output() -> None:
+    command = [sys.executable, "-c", "print('encoded')"]
+
+    completed = asyncio.run(execute_ffmpeg_async(command))
+
+    assert completed.returncode == 0
+    assert completed.stdout.strip() == "encoded"
+
+
+def test_execute_ffmpeg_async_raises_on_failure() -> None:
+    command = [sys.executable, "-c", "import sys; sys.stderr.write('boom'); sys.exit(1)"]
+
+    with pytest.raises(FFmpegExecutionError) as exc_info:
+        asyncio.run(execute_ffmpeg_async(command))
+
+    assert exc_info.value.stderr == "boom"
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from mcp_video_processing_service.job_models import JobStatus
+from mcp_video_processing_service.payload_client import MediaAsset, PayloadMediaClient
+from mcp_video_processing_service.tasks import (
+    _download_many,
+    _progress,
+    _ProgressBatcher,
+)
+
+
+class _RecordingStore:
+    def __init__(self) -> None:
+        self.updates: list[dict[str, Any]] = []
+
+    def update_job(self, job_id: str, **fields: Any) -> None:
+        assert job_id == "job-1"
+        self.updates.append(fields)
+
+
+def _payload_handler(request: httpx.Request) -> httpx.Response:
+    if request.url.host == "cdn.test":
+        return httpx.Response(200, content=b"data")
+    media_id = request.url.path.rsplit("/", 1)[-1]
+    return httpx.Response(200, json={"url": f"https://cdn.test/{media_id}.mp4", "filename": "clip.mp4"})
+
+
+def test_download_many_reports_progress_off_the_event_loop(tmp_path: Path) -> None:
+    report_threads: list[threading.Thread] = []
+    loop_threads: list[threading.Thread] = []
+
+    def report(_asset: MediaAsset, _path: Path) -> None:
+        report_threads.append(threading.current_thread())
+
+    def on_downloaded(_asset: MediaAsset, _path: Path) -> None:
+        loop_threads.append(threading.current_thread())
+
+    with PayloadMediaClient("https://cms.test/api", transport=httpx.MockTransport(_payload_handler)) as client:
+        downloads = _download_many(
+            client, ["a", "b"], tmp_path, report=report, on_downloaded=on_downloaded
+        )
+
+    assert [asset.media_id for asset, _ in downloads] == ["a", "b"]
+    assert len(report_threads) == 2
+    assert set(report_threads).isdisjoint(loop_threads)
+
+
+def test_progress_batcher_writes_status_and_step_changes_immediately() -> None:
+    store = _RecordingStore()
+    batcher = _ProgressBatcher(store, "job-1", min_interval=60)  # type: ignore[arg-type]
+
+    batcher.update(status=JobStatus.RUNNING, progress=_progress(5, "accepted", "Accepted"))
+    batcher.update(progress=_progress(10, "download", "Downloading"))
+
+    assert [update["progress"].current_step for update in store.updates] == ["accepted", "download"]
+    assert store.updates[0]["status"] == JobStatus.RUNNING
+
+
+def test_progress_batcher_coalesces_snapshots_within_a_step() -> None:
+    store = _RecordingStore()
+    batcher = _ProgressBatcher(store, "job-1", min_interval=60)  # type: ignore[arg-type]
+
+    batcher.update(progress=_progress(10, "download", "Downloaded 0 of 3"))
+    batcher.update(progress=_progress(20, "download", "Downloaded 1 of 3"))
+    batcher.update(progress=_progress(30, "download", "Downloaded 2 of 3"))
+    assert len(store.updates) == 1
+
+    batcher.flush()
+    assert len(store.updates) == 2
+    assert store.updates[1]["progress"].percent == 30
+
+    batcher.flush()
+    assert len(store.updates) == 2
+
+
+def test_progress_batcher_merges_metadata_across_calls() -> None:
+    store = _RecordingStore()
+    batcher = _ProgressBatcher(store, "job-1", min_interval=60)  # type: ignore[arg-type]
+
+    batcher.update(progress=_progress(10, "download", "Downloading"))
+    batcher.update(metadata={"width": 1280, "height": 480})
+    batcher.update(metadata={"height": 720})
+    assert len(store.updates) == 1
+
+    batcher.update(status=JobStatus.SUCCEEDED, metadata={"durationMs": 4000})
+
+    assert len(store.updates) == 2
+    assert store.updates[1]["status"] == JobStatus.SUCCEEDED
+    assert store.updates[1]["metadata"] == {"width": 1280, "height": 720, "durationMs": 4000}